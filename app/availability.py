@@ -0,0 +1,202 @@
+# app/availability.py
+"""
+Equipment status timeline and availability. Each EquipmentStatusLog opens an
+EquipmentStatusInterval that lasts until the next log of the same equipment, so range
+queries never replay the whole history. Rebuild with: python -m app.availability
+"""
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, insert, or_, update
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+
+from app.enums import EquipmentStatus, TicketType
+from app.models import Equipment, EquipmentStatusInterval, EquipmentStatusLog, MaintenanceTicket
+
+AVAILABLE_STATUSES = (EquipmentStatus.IN_SERVICE, EquipmentStatus.AVAILABLE)
+SECONDS_PER_HOUR = 3600
+
+def rebuild_equipment_intervals(session: Session, equipment_id: int, since: Optional[datetime] = None) -> None:
+    """
+    Recompute the intervals of one equipment starting at or after `since` (all of them when None).
+    """
+    interval = EquipmentStatusInterval
+    stale = delete(interval).where(interval.equipment_id == equipment_id)
+    logs_query = (
+        select(EquipmentStatusLog.id, EquipmentStatusLog.timestamp, EquipmentStatusLog.status)
+        .where(EquipmentStatusLog.equipment_id == equipment_id)
+        .order_by(EquipmentStatusLog.timestamp, EquipmentStatusLog.id)
+    )
+    if since is not None:
+        stale = stale.where(interval.start_time >= since)
+        logs_query = logs_query.where(EquipmentStatusLog.timestamp >= since)
+    session.execute(stale)
+    logs = session.exec(logs_query).all()
+    if not logs:
+        return
+
+    if since is not None:
+        # The interval in force before the rewritten tail now ends where the tail begins.
+        previous = (
+            select(interval.id)
+            .where(interval.equipment_id == equipment_id)
+            .where(interval.start_time < since)
+            .order_by(interval.start_time.desc(), interval.status_log_id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        session.execute(
+            update(interval).where(interval.id == previous).values(end_time=logs[0].timestamp)
+            .execution_options(synchronize_session=False)
+        )
+
+    session.execute(insert(interval), [
+        {
+            "equipment_id": equipment_id,
+            "status": status,
+            "start_time": timestamp,
+            "end_time": logs[position + 1].timestamp if position + 1 < len(logs) else None,
+            "status_log_id": log_id,
+        }
+        for position, (log_id, timestamp, status) in enumerate(logs)
+    ])
+
+def record_status_logs(session: Session, logs: Iterable[EquipmentStatusLog]) -> None:
+    """
+    Fold newly inserted status logs into the equipment timelines. Call before the commit that stores them.
+    """
+    since: dict[int, datetime] = {}
+    for log in logs:
+        since[log.equipment_id] = min(log.timestamp, since.get(log.equipment_id, log.timestamp))
+    if not since:
+        return
+    session.flush()
+    for equipment_id in sorted(since):
+        rebuild_equipment_intervals(session, equipment_id, since[equipment_id])
+
+def rebuild_intervals(session: Session) -> int:
+    """
+    Recompute every equipment timeline from the status logs. Returns the number of intervals written.
+    """
+    session.execute(delete(EquipmentStatusInterval))
+    equipment_ids = session.exec(select(EquipmentStatusLog.equipment_id).distinct()).all()
+    for equipment_id in equipment_ids:
+        rebuild_equipment_intervals(session, equipment_id)
+    session.commit()
+    return session.exec(select(func.count()).select_from(EquipmentStatusInterval)).one()
+
+def interval_in_force_id(as_of: datetime):
+    """
+    Correlated subquery: id of the interval in force at `as_of` for the enclosing query's Equipment row,
+    i.e. its latest interval starting at or before that time. One seek on (equipment_id, start_time).
+    """
+    candidate = aliased(EquipmentStatusInterval)
+    return (
+        select(candidate.id)
+        .where(candidate.equipment_id == Equipment.id)
+        .where(candidate.start_time <= as_of)
+        .order_by(candidate.start_time.desc(), candidate.status_log_id.desc())
+        .limit(1)
+        .correlate(Equipment)
+        .scalar_subquery()
+    )
+
+def intervals_in_force(as_of: datetime, equipment_ids: Optional[list[int]] = None):
+    """
+    Statement selecting, per equipment, the interval in force at `as_of`.
+    """
+    latest_ids = select(interval_in_force_id(as_of)).select_from(Equipment)
+    if equipment_ids is not None:
+        latest_ids = latest_ids.where(Equipment.id.in_(equipment_ids))
+    return select(EquipmentStatusInterval).where(EquipmentStatusInterval.id.in_(latest_ids))
+
+def intervals_overlapping(session: Session, start: datetime, end: datetime, equipment_ids: Optional[list[int]] = None) -> list[EquipmentStatusInterval]:
+    starting_inside = (
+        select(EquipmentStatusInterval)
+        .where(EquipmentStatusInterval.start_time > start)
+        .where(EquipmentStatusInterval.start_time < end)
+    )
+    if equipment_ids is not None:
+        starting_inside = starting_inside.where(EquipmentStatusInterval.equipment_id.in_(equipment_ids))
+    return [*session.exec(intervals_in_force(start, equipment_ids)).all(), *session.exec(starting_inside).all()]
+
+def overlap_hours(start: datetime, end: datetime, window_start: datetime, window_end: datetime) -> float:
+    seconds = (min(end, window_end) - max(start, window_start)).total_seconds()
+    return max(seconds, 0.0) / SECONDS_PER_HOUR
+
+def merge_windows(windows: list[tuple[datetime, datetime]]) -> list[tuple[datetime, datetime]]:
+    merged = []
+    for window_start, window_end in sorted(windows):
+        if merged and window_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], window_end))
+        else:
+            merged.append((window_start, window_end))
+    return merged
+
+def equipment_availability(session: Session, start: datetime, end: datetime, equipment_ids: Optional[list[int]] = None) -> list[dict]:
+    """
+    Time in each status, availability factor and forced-outage hours per equipment over [start, end).
+    The availability factor is the share of the known time spent in service or available; time before
+    an equipment's first status log is reported as unknown. Forced-outage hours are the out-of-service
+    hours covered by an open or completed fault report ticket of the equipment.
+    """
+    until = min(end, datetime.utcnow())
+    period_hours = overlap_hours(start, until, start, until)
+
+    equipment_query = select(Equipment.id, Equipment.name).order_by(Equipment.id)
+    if equipment_ids is not None:
+        equipment_query = equipment_query.where(Equipment.id.in_(equipment_ids))
+    equipment = session.exec(equipment_query).all()
+
+    hours = {equipment_id: dict.fromkeys(EquipmentStatus, 0.0) for equipment_id, _ in equipment}
+    outages: dict[int, list[tuple[datetime, datetime]]] = {}
+    for interval in intervals_overlapping(session, start, until, equipment_ids):
+        interval_end = interval.end_time or until
+        hours[interval.equipment_id][interval.status] += overlap_hours(interval.start_time, interval_end, start, until)
+        if interval.status == EquipmentStatus.OUT_OF_SERVICE:
+            outages.setdefault(interval.equipment_id, []).append((interval.start_time, interval_end))
+
+    faults: dict[int, list[tuple[datetime, datetime]]] = {}
+    if outages:
+        tickets = session.exec(
+            select(MaintenanceTicket.equipment_id, MaintenanceTicket.created_at, MaintenanceTicket.completed_at)
+            .where(MaintenanceTicket.equipment_id.in_(list(outages)))
+            .where(MaintenanceTicket.ticket_type == TicketType.FAULT_REPORT)
+            .where(MaintenanceTicket.created_at < until)
+            .where(or_(MaintenanceTicket.completed_at.is_(None), MaintenanceTicket.completed_at > start))
+        ).all()
+        for equipment_id, created_at, completed_at in tickets:
+            faults.setdefault(equipment_id, []).append((created_at, completed_at or until))
+
+    results = []
+    for equipment_id, name in equipment:
+        in_state = hours[equipment_id]
+        known_hours = sum(in_state.values())
+        available_hours = sum(in_state[status] for status in AVAILABLE_STATUSES)
+        forced_outage_hours = sum(
+            overlap_hours(outage_start, outage_end, max(fault_start, start), min(fault_end, until))
+            for outage_start, outage_end in outages.get(equipment_id, ())
+            for fault_start, fault_end in merge_windows(faults.get(equipment_id, []))
+        )
+        results.append({
+            "equipment_id": equipment_id,
+            "equipment_name": name,
+            "period_hours": period_hours,
+            "unknown_hours": max(period_hours - known_hours, 0.0),
+            "hours_in_state": in_state,
+            "available_hours": available_hours,
+            "availability_factor": available_hours / known_hours if known_hours else None,
+            "out_of_service_hours": in_state[EquipmentStatus.OUT_OF_SERVICE],
+            "forced_outage_hours": forced_outage_hours,
+        })
+    return results
+
+if __name__ == "__main__":
+    from app.database import engine
+    from app.migrations import run_migrations
+
+    run_migrations(engine)
+    with Session(engine) as session:
+        count = rebuild_intervals(session)
+    print(f"Rebuilt {count} equipment status intervals.")
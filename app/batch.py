@@ -0,0 +1,63 @@
+# app/batch.py
+"""
+Shared helpers for the batch submission endpoints: one set-based lookup per
+referenced table and per-item error reporting.
+"""
+from typing import Iterable
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, select
+
+from app.schemas import BatchItemError
+from app.shift_events import stage_changes
+from app.versioning import VERSIONED_MODELS, assign_change_versions
+
+MAX_BATCH_ITEMS = 1000
+
+def check_batch_size(items: list) -> None:
+    if len(items) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {MAX_BATCH_ITEMS} items",
+        )
+
+def existing_ids(session: Session, model: type[SQLModel], ids: Iterable[int]) -> set[int]:
+    """
+    The subset of `ids` that exist in the table of `model`, fetched with a single IN query.
+    """
+    wanted = set(ids)
+    if not wanted:
+        return set()
+    return set(session.exec(select(model.id).where(model.id.in_(wanted))).all())
+
+def missing_reference_errors(items: list, checks: list[tuple[str, set[int], str]]) -> list[BatchItemError]:
+    """
+    One error per item whose referenced id is not in the known set.
+    `checks` holds (attribute name, known ids, error message) tuples.
+    """
+    errors = []
+    for index, item in enumerate(items):
+        for attribute, known, message in checks:
+            if getattr(item, attribute) not in known:
+                errors.append(BatchItemError(index=index, detail=message))
+                break
+    return errors
+
+def bulk_insert(session: Session, model: type[SQLModel], objects: list[SQLModel]) -> list[int]:
+    """
+    Insert validated instances with a single executemany INSERT ... RETURNING and set their ids.
+    Returns the new ids in the order of `objects`. The instances are not added to the session,
+    so their changes are staged for the shift event feed here.
+    """
+    if not objects:
+        return []
+    if issubclass(model, VERSIONED_MODELS):
+        assign_change_versions(session, objects)
+    rows = [obj.model_dump(exclude={"id"}) for obj in objects]
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    new_ids = list(session.scalars(statement, rows))
+    for obj, new_id in zip(objects, new_ids):
+        obj.id = new_id
+    stage_changes(session, objects)
+    return new_ids
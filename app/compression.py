@@ -0,0 +1,182 @@
+# app/compression.py
+"""
+Negotiated response compression (gzip, and brotli / zstd when installed).
+Small, already encoded or already compressed responses and event streams are sent untouched.
+"""
+import gzip
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError: # Optional dependency: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError: # Optional dependency: pip install zstandard
+    zstandard = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+# Media types whose bodies are compressed already; a prefix ending in "." or "/" covers a family.
+COMPRESSED_MEDIA_TYPES = (
+    "application/vnd.apache.parquet", "application/vnd.apache.arrow.",
+    "application/gzip", "application/x-gzip", "application/zip", "application/zstd",
+    "image/png", "image/jpeg", "image/webp", "audio/", "video/",
+)
+
+# Server preference when the client rates several codings equally.
+AVAILABLE_ENCODINGS = tuple(
+    name for name, module in (("br", brotli), ("zstd", zstandard), ("gzip", gzip)) if module is not None
+)
+
+def negotiate_encoding(accept_encoding: str | None, available: tuple[str, ...] = AVAILABLE_ENCODINGS) -> str:
+    """
+    Pick the content coding for a response from an Accept-Encoding header. Returns "identity" if none fits.
+    """
+    qualities: dict[str, float] = {}
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        try:
+            qualities[name] = float(params.strip().lower().removeprefix("q=") or 1)
+        except ValueError:
+            qualities[name] = 0.0
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = "identity", 0.0
+    for name in available:
+        quality = qualities.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+def is_compressed_media(content_type: str) -> bool:
+    return content_type.split(";")[0].strip().lower().startswith(COMPRESSED_MEDIA_TYPES)
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+class StreamCompressor:
+    """
+    Incremental compressor for streamed bodies, with one interface for every coding.
+    """
+
+    def __init__(self, encoding: str):
+        if encoding == "gzip":
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._finish = compressor.compress, compressor.flush
+        elif encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress, self._finish = compressor.process, compressor.finish
+        elif encoding == "zstd":
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            self._compress, self._finish = compressor.compress, compressor.flush
+        else:
+            raise ValueError(f"Unsupported content coding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+        await CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+class CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Message | None = None
+        self.passthrough = False
+        self.compressor: StreamCompressor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether compression applies.
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            await self.start_response(start_message, message)
+            return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        body = self.compressor.compress(message.get("body", b""))
+        if not message.get("more_body", False):
+            body += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": message.get("more_body", False)})
+
+    async def start_response(self, start_message: Message, message: Message) -> None:
+        headers = MutableHeaders(raw=start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        content_type = headers.get("content-type", "")
+        compressible = (
+            "content-encoding" not in headers
+            and not content_type.startswith("text/event-stream")
+            and not is_compressed_media(content_type)
+            and start_message["status"] not in (204, 304)
+        )
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+        if not compressible or (not more_body and len(body) < self.minimum_size):
+            self.passthrough = True
+            await self.send(start_message)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        # The encoded bytes differ from the identity representation, but it is still the same content.
+        if "etag" in headers and not headers["etag"].startswith("W/"):
+            headers["ETag"] = "W/" + headers["etag"]
+        if more_body:
+            if "content-length" in headers:
+                del headers["content-length"]
+            self.compressor = StreamCompressor(self.encoding)
+            body = self.compressor.compress(body)
+        else:
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+        await self.send(start_message)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
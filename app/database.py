@@ -1,14 +1,90 @@
 # app/database.py
 import os
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 sqlite_file_name = "database.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
 
 database_url = os.getenv("DATABASE_URL", default=sqlite_url)
 
-engine = create_engine(database_url)
+# Async drivers that enable async mode, mapped to the sync driver used by the rest of the app.
+ASYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql+psycopg2",
+}
+
+# --- ENGINE PROFILE ---
+# Applied to every SQLite connection. WAL lets report reads run alongside shift-log writes.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")), # Negative values are KiB: 64 MiB
+}
+
+# Connection pool settings for server databases (PostgreSQL).
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+def engine_options(db_url: URL) -> dict:
+    """
+    Keyword arguments for create_engine / create_async_engine according to the backend.
+    """
+    if db_url.get_backend_name() == "sqlite":
+        # Sessions are opened in one threadpool worker and may be closed in another.
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+def pool_stats(db_engine) -> dict:
+    """
+    Current state of an engine's connection pool. Counters only exist on queue-based pools.
+    """
+    pool = db_engine.pool
+    stats = {"pool_class": type(pool).__name__, "status": pool.status()}
+    for counter in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, counter):
+            stats[counter] = getattr(pool, counter)()
+    return stats
+
+url = make_url(database_url)
+async_mode = url.drivername in ASYNC_DRIVERS
+sync_url = url.set(drivername=ASYNC_DRIVERS[url.drivername]) if async_mode else url
+is_sqlite = url.get_backend_name() == "sqlite"
+
+engine = create_engine(sync_url, **engine_options(sync_url))
+if is_sqlite:
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+async_engine = None
+if async_mode:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    async_engine = create_async_engine(url, **engine_options(url))
+    if is_sqlite:
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
 
 def get_session():
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_async_session():
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
@@ -1,21 +1,73 @@
 # app/dependencies.py
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import Depends, HTTPException, status
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.database import get_session, get_async_session
 from app.models import User
 from app.enums import UserRole
-from app.routers.login import get_current_user
+from app.routers.login import get_current_user, get_current_user_async
+from app.shift_registry import ShiftState, shift_registry, shift_state_query
 
 
+def check_role(current_user: User, required_roles: list[UserRole]) -> User:
+    if current_user.role not in required_roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission denied. Required role: {[role.value for role in required_roles]}",            
+        )    
+    return current_user
+
 def require_role(required_roles: list[UserRole]):
     """
     This is a dependency that generates another dependency. Verify that the current user has the required role.
     """
     def role_checker(current_user: Annotated[User, Depends(get_current_user)]) -> User:
-        if current_user.role not in required_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied. Required role: {[role.value for role in required_roles]}",            
-            )    
-        return current_user
-    return role_checker    
\ No newline at end of file
+        return check_role(current_user, required_roles)
+    return role_checker
+
+def require_role_async(required_roles: list[UserRole]):
+    """
+    require_role for the async routers, which must not touch the sync engine.
+    """
+    async def role_checker(current_user: Annotated[User, Depends(get_current_user_async)]) -> User:
+        return check_role(current_user, required_roles)
+    return role_checker
+
+def check_open_shift(shift_state: Optional[ShiftState], current_user: User) -> ShiftState:
+    """
+    The rule for writing shift logs: the shift must exist, be OPEN and be held by the current user.
+    """
+    if shift_state is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
+    if not shift_state.is_open:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add logs to a closed shift")
+    if shift_state.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not authorized to log data for this shift")
+    return shift_state
+
+def require_open_shift(
+    shift_id: int,
+    session: Annotated[Session, Depends(get_session)],
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> ShiftState:
+    """
+    Write guard for shift log endpoints. Closed shifts are rejected from the shift registry;
+    an open shift is re-read and locked in the request's transaction, the one the write commits in.
+    """
+    return check_open_shift(shift_registry.lookup(session, shift_id, lock=True), current_user)
+
+async def require_open_shift_async(
+    shift_id: int,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    current_user: Annotated[User, Depends(get_current_user_async)],
+) -> ShiftState:
+    shift_state = shift_registry.get(shift_id)
+    if shift_state is None:
+        row = (await session.exec(shift_state_query(shift_id, lock=True))).first()
+        shift_state = shift_registry.remember_row(row)
+    return check_open_shift(shift_state, current_user)
+
+OpenShift = Annotated[ShiftState, Depends(require_open_shift)]
+OpenShiftAsync = Annotated[ShiftState, Depends(require_open_shift_async)]
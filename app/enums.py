@@ -54,4 +54,38 @@ class NoveltyType(str, Enum):
     GENERAL = "GENERAL"
     SPECIAL_INSTRUCTION = "SPECIAL_INSTRUCTION"
     SAFETY_INCIDENT = "SAFETY_INCIDENT"
-    ENVIRONMENTAL_INCIDENT = "ENVIRONMENTAL_INCIDENT"    
\ No newline at end of file
+    ENVIRONMENTAL_INCIDENT = "ENVIRONMENTAL_INCIDENT"        
+    
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    
+class ExportLogType(str, Enum):
+    SHIFTS = "shifts"
+    STATUS_LOGS = "status_logs"
+    EVENT_LOGS = "event_logs"
+    TASK_LOGS = "task_logs"
+    NOVELTY_LOGS = "novelty_logs"
+    GENERATION_RAMPS = "generation_ramps"
+    TANK_READINGS = "tank_readings"
+    OPERATIONAL_READINGS = "operational_readings"
+    
+class ColumnarFormat(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    
+class RollupGranularity(str, Enum):
+    HOUR = "HOUR"
+    DAY = "DAY"
+    SHIFT = "SHIFT"
+    
+class SearchSource(str, Enum):
+    NOVELTY = "novelty"
+    EVENT = "event"
+    MAINTENANCE_TICKET = "maintenance_ticket"
+    LICENSE = "license"
+    
+class KpiPeriod(str, Enum):
+    DAY = "DAY"
+    WEEK = "WEEK"
+    MONTH = "MONTH"
@@ -0,0 +1,225 @@
+# app/exports.py
+"""
+Streaming exports. Rows are fetched in batches and written out one batch at a time,
+so memory use does not depend on the size of the range.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlmodel import SQLModel, Session, select
+
+from app.database import engine
+from app.enums import ExportFormat, ExportLogType, ColumnarFormat
+from app.models import (
+    Shift, EquipmentStatusLog, EventLog, TaskLog, NoveltyLog, GenerationRamp,
+    TankReading, OperationalReading, OperationalParameter, Equipment
+)
+from app.schemas import (
+    ShiftRead, StatusLogRead, EventLogRead, TaskLogRead, NoveltyLogRead, GenerationRampRead,
+    TankReadingRead, OperationalReadingRead
+)
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError: # Optional dependency: pip install pyarrow
+    pyarrow = None
+
+EXPORT_BATCH_SIZE = 1000
+# Columnar exports write one Parquet row group / Arrow record batch per fetch.
+COLUMNAR_BATCH_SIZE = 50_000
+
+# Log type -> (table model, schema used for each exported row).
+EXPORT_SOURCES: dict[ExportLogType, tuple[type[SQLModel], type[SQLModel]]] = {
+    ExportLogType.SHIFTS: (Shift, ShiftRead),
+    ExportLogType.STATUS_LOGS: (EquipmentStatusLog, StatusLogRead),
+    ExportLogType.EVENT_LOGS: (EventLog, EventLogRead),
+    ExportLogType.TASK_LOGS: (TaskLog, TaskLogRead),
+    ExportLogType.NOVELTY_LOGS: (NoveltyLog, NoveltyLogRead),
+    ExportLogType.GENERATION_RAMPS: (GenerationRamp, GenerationRampRead),
+    ExportLogType.TANK_READINGS: (TankReading, TankReadingRead),
+    ExportLogType.OPERATIONAL_READINGS: (OperationalReading, OperationalReadingRead),
+}
+
+def export_columns(log_type: ExportLogType) -> list[str]:
+    _, schema = EXPORT_SOURCES[log_type]
+    columns = list(schema.model_fields)
+    if log_type != ExportLogType.SHIFTS and "shift_id" not in columns:
+        columns.insert(0, "shift_id")
+    return columns
+
+def export_query(log_type: ExportLogType, start: datetime, end: datetime):
+    """
+    Rows of closed shifts that started in [start, end), grouped by shift.
+    """
+    model, _ = EXPORT_SOURCES[log_type]
+    query = select(model)
+    if model is not Shift:
+        query = query.join(Shift, model.shift_id == Shift.id)
+    return (
+        query
+        .where(Shift.status == "CLOSED")
+        .where(Shift.start_time >= start)
+        .where(Shift.start_time < end)
+        .order_by(Shift.start_time, Shift.id, model.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+def export_row(log_type: ExportLogType, row: SQLModel) -> dict:
+    _, schema = EXPORT_SOURCES[log_type]
+    data = schema.model_validate(row).model_dump(mode="json")
+    if log_type != ExportLogType.SHIFTS:
+        data.setdefault("shift_id", row.shift_id)
+    return data
+
+def stream_export(log_type: ExportLogType, export_format: ExportFormat, start: datetime, end: datetime) -> Iterator[str]:
+    """
+    Yield the export one batch at a time. The generator opens its own session because
+    request-scoped sessions are closed before a streaming response starts sending.
+    """
+    columns = export_columns(log_type)
+    with Session(engine) as session:
+        result = session.exec(export_query(log_type, start, end))
+        if export_format == ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            yield buffer.getvalue()
+        for batch in result.partitions():
+            if export_format == ExportFormat.CSV:
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+                writer.writerows(export_row(log_type, row) for row in batch)
+                chunk = buffer.getvalue()
+            else:
+                chunk = "".join(json.dumps(export_row(log_type, row)) + "\n" for row in batch)
+            session.expunge_all()
+            yield chunk
+
+# --- COLUMNAR EXPORT OF OPERATIONAL READINGS ---
+
+# Output column -> selected expression, in file order.
+READING_EXPORT_COLUMNS = {
+    "reading_id": OperationalReading.id,
+    "timestamp": OperationalReading.timestamp,
+    "shift_id": OperationalReading.shift_id,
+    "parameter_id": OperationalReading.parameter_id,
+    "parameter_name": OperationalParameter.name,
+    "unit": OperationalParameter.unit,
+    "equipment_id": OperationalReading.equipment_id,
+    "equipment_name": Equipment.name,
+    "value": OperationalReading.value,
+    "user_id": OperationalReading.user_id,
+}
+
+def reading_export_schema():
+    return pyarrow.schema([
+        ("reading_id", pyarrow.int64()),
+        ("timestamp", pyarrow.timestamp("us")),
+        ("shift_id", pyarrow.int64()),
+        ("parameter_id", pyarrow.int64()),
+        ("parameter_name", pyarrow.string()),
+        ("unit", pyarrow.string()),
+        ("equipment_id", pyarrow.int64()),
+        ("equipment_name", pyarrow.string()),
+        ("value", pyarrow.float64()),
+        ("user_id", pyarrow.int64()),
+    ])
+
+def reading_export_query(
+    parameter_id: Optional[int],
+    equipment_id: Optional[int],
+    start: Optional[datetime],
+    end: Optional[datetime],
+):
+    query = (
+        select(*READING_EXPORT_COLUMNS.values())
+        .join(OperationalParameter, OperationalReading.parameter_id == OperationalParameter.id)
+        .join(Equipment, OperationalReading.equipment_id == Equipment.id)
+    )
+    if parameter_id is not None:
+        query = query.where(OperationalReading.parameter_id == parameter_id)
+    if equipment_id is not None:
+        query = query.where(OperationalReading.equipment_id == equipment_id)
+    if start is not None:
+        query = query.where(OperationalReading.timestamp >= start)
+    if end is not None:
+        query = query.where(OperationalReading.timestamp < end)
+    return (
+        query
+        .order_by(OperationalReading.timestamp, OperationalReading.id)
+        .execution_options(yield_per=COLUMNAR_BATCH_SIZE)
+    )
+
+class DrainableSink:
+    """
+    Write-only file object for the Arrow / Parquet writers. Whatever has been written
+    is handed out by drain(), so the response can send it before the next batch.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def stream_readings_columnar(
+    export_format: ColumnarFormat,
+    parameter_id: Optional[int] = None,
+    equipment_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Iterator[bytes]:
+    """
+    Yield operational readings, joined with parameter and equipment names, as a
+    Parquet file or an Arrow IPC stream. Each fetched batch becomes one row group
+    (or record batch) and is sent before the next one is read.
+    """
+    schema = reading_export_schema()
+    sink = DrainableSink()
+    if export_format == ColumnarFormat.PARQUET:
+        writer = pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+
+    try:
+        with Session(engine) as session:
+            result = session.exec(reading_export_query(parameter_id, equipment_id, start, end))
+            for batch in result.partitions():
+                columns = list(zip(*batch))
+                record_batch = pyarrow.record_batch(
+                    [pyarrow.array(column, type=field.type) for column, field in zip(columns, schema)],
+                    schema=schema,
+                )
+                writer.write_batch(record_batch)
+                yield sink.drain()
+    finally:
+        # Also runs when the client disconnects and the generator is closed early.
+        writer.close()
+    yield sink.drain()
@@ -0,0 +1,48 @@
+# app/http_cache.py
+"""
+HTTP conditional requests (ETag / If-None-Match). Catalog tags are a digest of the
+serialized list, so every worker process computes the same tag.
+"""
+import hashlib
+from functools import lru_cache
+from typing import Sequence
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlmodel import SQLModel
+
+CATALOG_CACHE_CONTROL = "private, no-cache" # Browsers keep the copy but revalidate every time
+REPORT_CACHE_CONTROL = "private, max-age=86400" # Closed reports never change
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison, as RFC 9110 prescribes for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+def conditional_headers(request: Request, etag: str, cache_control: str) -> dict[str, str]:
+    """
+    Raise 304 Not Modified when the client already holds this ETag; otherwise
+    return the validator and caching headers for the full response.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return headers
+
+@lru_cache
+def list_adapter(schema: type[SQLModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+def catalog_response(request: Request, rows: Sequence, schema: type[SQLModel]) -> Response:
+    """
+    Serialize a catalog list with its read schema, answering 304 when the client already holds the same content.
+    """
+    content = list_adapter(schema).dump_json([schema.model_validate(row) for row in rows])
+    etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+    headers = conditional_headers(request, etag, CATALOG_CACHE_CONTROL)
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -0,0 +1,203 @@
+# app/kpis.py
+"""
+Operational KPIs per day, week or month, from GROUP BY queries over indexed timestamps.
+Closed periods are cached until a write lands in them; the period in progress also
+expires after KPI_OPEN_PERIOD_TTL_SECONDS.
+"""
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import Date, cast, func, or_
+from sqlmodel import Session, select
+
+from app.cache import TTLCache
+from app.enums import EventType, KpiPeriod, NoveltyType
+from app.models import EventLog, License, MaintenanceTicket, NoveltyLog
+from app.shift_events import ShiftChange, shift_event_hub
+
+MAX_KPI_PERIODS = 400
+KPI_OPEN_PERIOD_TTL_SECONDS = int(os.getenv("KPI_OPEN_PERIOD_TTL_SECONDS", "60"))
+# Open-ended intervals (tickets not completed, licenses not closed) end here.
+FAR_FUTURE = np.datetime64("9999-12-31", "us")
+
+kpi_cache = TTLCache(maxsize=4096, ttl=None)
+
+def period_floor(day: date, period: KpiPeriod) -> date:
+    if period == KpiPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == KpiPeriod.MONTH:
+        return day.replace(day=1)
+    return day
+
+def next_period(start: date, period: KpiPeriod) -> date:
+    if period == KpiPeriod.WEEK:
+        return start + timedelta(weeks=1)
+    if period == KpiPeriod.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+def period_starts(start: date, end: date, period: KpiPeriod) -> list[date]:
+    """
+    Start of every period overlapping [start, end], both days included.
+    """
+    starts = [period_floor(start, period)]
+    while next_period(starts[-1], period) <= end:
+        starts.append(next_period(starts[-1], period))
+    return starts
+
+def at_midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+def period_start_sql(dialect_name: str, period: KpiPeriod, column):
+    """
+    SQL expression truncating `column` to the first day of its period (weeks start on Monday).
+    """
+    if dialect_name == "postgresql":
+        return cast(func.date_trunc(period.value.lower(), column), Date)
+    # SQLite: 'weekday 0' moves forward to Sunday, so '-6 days' lands on that week's Monday.
+    modifiers = {
+        KpiPeriod.DAY: (),
+        KpiPeriod.WEEK: ("weekday 0", "-6 days"),
+        KpiPeriod.MONTH: ("start of month",),
+    }
+    return func.date(column, *modifiers[period])
+
+def as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+def empty_kpis(start: date, period: KpiPeriod, now: datetime) -> dict:
+    end = next_period(start, period)
+    return {
+        "period": period,
+        "period_start": start,
+        "period_end": end,
+        "closed": at_midnight(end) <= now,
+        "events": dict.fromkeys(EventType, 0),
+        "tickets_opened": 0,
+        "tickets_completed": 0,
+        "tickets_open_at_end": 0,
+        "active_licenses": 0,
+        "safety_incidents": 0,
+    }
+
+def count_by_period(session: Session, period: KpiPeriod, column, span: tuple[datetime, datetime], *filters, key=None):
+    """
+    Rows of (period start, [key,] count) for rows with `column` inside `span`.
+    """
+    bucket = period_start_sql(session.get_bind().dialect.name, period, column).label("period_start")
+    columns = (bucket, key) if key is not None else (bucket,)
+    return session.exec(
+        select(*columns, func.count())
+        .where(column >= span[0])
+        .where(column < span[1])
+        .where(*filters)
+        .group_by(*columns)
+    ).all()
+
+def overlap_counts(intervals: list[tuple], bounds: np.ndarray, at_end: bool) -> np.ndarray:
+    """
+    Per period, the number of [start, end) intervals in force at its end (at_end) or at any time during it.
+    `bounds` holds the start and end of every period as datetime64 pairs.
+    """
+    if not intervals:
+        return np.zeros(len(bounds), dtype=int)
+    starts = np.array([start for start, _ in intervals], dtype="datetime64[us]")
+    ends = np.array([end if end is not None else FAR_FUTURE for _, end in intervals], dtype="datetime64[us]")
+    period_starts, period_ends = bounds[:, :1], bounds[:, 1:]
+    if at_end:
+        in_force = (starts < period_ends) & (ends >= period_ends)
+    else:
+        in_force = (starts < period_ends) & (ends > period_starts)
+    return in_force.sum(axis=1)
+
+def compute_kpis(session: Session, period: KpiPeriod, starts: list[date]) -> dict[date, dict]:
+    """
+    KPIs of the given periods (in ascending order), with one query per metric over their span.
+    """
+    now = datetime.utcnow()
+    results = {start: empty_kpis(start, period, now) for start in starts}
+    span = (at_midnight(starts[0]), at_midnight(next_period(starts[-1], period)))
+
+    for period_start, event_type, count in count_by_period(session, period, EventLog.timestamp, span, key=EventLog.event_type):
+        if as_date(period_start) in results:
+            results[as_date(period_start)]["events"][EventType(event_type)] = count
+    for period_start, count in count_by_period(
+        session, period, NoveltyLog.timestamp, span, NoveltyLog.novelty_type == NoveltyType.SAFETY_INCIDENT
+    ):
+        if as_date(period_start) in results:
+            results[as_date(period_start)]["safety_incidents"] = count
+    for period_start, count in count_by_period(session, period, MaintenanceTicket.created_at, span):
+        if as_date(period_start) in results:
+            results[as_date(period_start)]["tickets_opened"] = count
+    for period_start, count in count_by_period(session, period, MaintenanceTicket.completed_at, span):
+        if as_date(period_start) in results:
+            results[as_date(period_start)]["tickets_completed"] = count
+
+    bounds = np.array(
+        [(at_midnight(start), at_midnight(next_period(start, period))) for start in starts], dtype="datetime64[us]"
+    )
+    tickets = session.exec(
+        select(MaintenanceTicket.created_at, MaintenanceTicket.completed_at)
+        .where(MaintenanceTicket.created_at < span[1])
+        .where(or_(MaintenanceTicket.completed_at.is_(None), MaintenanceTicket.completed_at >= span[0]))
+    ).all()
+    licenses = session.exec(
+        select(License.start_time, License.end_time)
+        .where(License.start_time < span[1])
+        .where(or_(License.end_time.is_(None), License.end_time > span[0]))
+    ).all()
+    open_tickets = overlap_counts(tickets, bounds, at_end=True)
+    active_licenses = overlap_counts(licenses, bounds, at_end=False)
+    for index, start in enumerate(starts):
+        results[start]["tickets_open_at_end"] = int(open_tickets[index])
+        results[start]["active_licenses"] = int(active_licenses[index])
+    return results
+
+def operational_kpis(session: Session, period: KpiPeriod, start: date, end: date) -> list[dict]:
+    """
+    KPIs of every period overlapping [start, end], served from the cache where possible.
+    """
+    starts = period_starts(start, end, period)
+    cached = {period_start: kpi_cache.get((period, period_start)) for period_start in starts}
+    missing = [period_start for period_start, kpis in cached.items() if kpis is None]
+    if missing:
+        for period_start, kpis in compute_kpis(session, period, missing).items():
+            kpi_cache.set((period, period_start), kpis, ttl=None if kpis["closed"] else KPI_OPEN_PERIOD_TTL_SECONDS)
+            cached[period_start] = kpis
+    return [cached[period_start] for period_start in starts]
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+# Time span of a change that KPIs depend on; None means open-ended. Tickets and licenses
+# are open-ended: closing them (possibly backdated) ends them before periods that were
+# cached while they were still open, and the change only carries the new end.
+KPI_CHANGE_SPANS = {
+    "event": lambda data: (data["timestamp"], data["timestamp"]),
+    "novelty": lambda data: (data["timestamp"], data["timestamp"]),
+    "maintenance_ticket": lambda data: (data["created_at"], None),
+    "license": lambda data: (data["start_time"], None),
+}
+
+def invalidate_kpis(changes: list[ShiftChange]) -> None:
+    """
+    Drop the cached periods a committed change falls into.
+    """
+    spans = [
+        (parse_timestamp(first), parse_timestamp(last))
+        for first, last in (KPI_CHANGE_SPANS[change.kind](change.data) for change in changes if change.kind in KPI_CHANGE_SPANS)
+    ]
+    if not spans:
+        return
+
+    def stale(key, kpis) -> bool:
+        period_start, period_end = at_midnight(kpis["period_start"]), at_midnight(kpis["period_end"])
+        return any(first < period_end and (last is None or last >= period_start) for first, last in spans)
+
+    kpi_cache.invalidate(stale)
+
+shift_event_hub.add_commit_listener(invalidate_kpis)
@@ -1,17 +1,19 @@
 # app/main.py 
 from fastapi import FastAPI 
-from sqlmodel import SQLModel
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine
+from app.database import engine, async_mode
+from app.migrations import run_migrations
+from app.pagination import NEXT_CURSOR_HEADER
+from app.compression import CompressionMiddleware, COMPRESSION_MIN_SIZE
 from app.routers import (
     equipment, shifts, users, login, personnel, attendance, 
     tank, license, tasks, parameters, maintenance,
-    reports
+    reports, readings, search, plant_state, analytics, system, shifts_async, reports_async
 )    
 
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine) 
+    run_migrations(engine)
     
 app = FastAPI()
 
@@ -27,12 +29,20 @@ app.add_middleware(
     allow_credentials=True,   
     allow_methods=["*"],      
     allow_headers=["*"],      
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
-    
+
+# In async mode the async routers go first so they take over the routes they redefine.
+if async_mode:
+    app.include_router(shifts_async.router)
+    app.include_router(reports_async.router)
+
 app.include_router(equipment.router) 
 app.include_router(shifts.router)
 app.include_router(users.router)
@@ -44,4 +54,18 @@ app.include_router(license.router)
 app.include_router(tasks.router)
 app.include_router(parameters.router)
 app.include_router(maintenance.router)    
-app.include_router(reports.router)    
\ No newline at end of file
+app.include_router(reports.router)
+app.include_router(readings.router)
+app.include_router(search.router)
+app.include_router(plant_state.router)
+app.include_router(analytics.router)
+app.include_router(system.router)
+
+if async_mode:
+    # Drop the sync routes shadowed by their async counterparts so each path/method is served and documented once.
+    registered = set()
+    for route in list(app.router.routes):
+        key = (route.path, frozenset(getattr(route, "methods", None) or ()))
+        if key in registered:
+            app.router.routes.remove(route)
+        registered.add(key)
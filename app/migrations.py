@@ -0,0 +1,77 @@
+# app/migrations.py
+"""
+Schema upgrades for databases created by an earlier version of the models.
+Every step is idempotent. Run manually with: python -m app.migrations
+"""
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel
+
+import app.models  # noqa: F401  Registers every table on SQLModel.metadata
+from app.search import create_search_index
+
+def add_missing_columns(db_engine) -> list[str]:
+    """
+    Add the columns declared in app/models.py that an existing table does not have yet.
+    Columns are added with their server default, so existing rows get a value; a NOT NULL
+    column without a server default is added as nullable.
+    """
+    added = []
+    with db_engine.begin() as connection:
+        inspector = inspect(connection)
+        existing_tables = set(inspector.get_table_names())
+        preparer = connection.dialect.identifier_preparer
+        ddl_compiler = connection.dialect.ddl_compiler(connection.dialect, None)
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                ddl = (
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} "
+                    f"{column.type.compile(dialect=connection.dialect)}"
+                )
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {ddl_compiler.get_column_default_string(column)}"
+                    if not column.nullable:
+                        ddl += " NOT NULL"
+                connection.execute(text(ddl))
+                added.append(f"{table.name}.{column.name}")
+    return added
+
+def create_missing_indexes(db_engine) -> list[str]:
+    """
+    Create the indexes declared in app/models.py that an existing table does not have yet.
+    """
+    created = []
+    with db_engine.begin() as connection:
+        inspector = inspect(connection)
+        existing_tables = set(inspector.get_table_names())
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name not in existing_indexes:
+                    index.create(connection)
+                    created.append(index.name)
+    return created
+
+def run_migrations(db_engine) -> list[str]:
+    """
+    Bring the database schema up to date with the models. Returns a description of each applied step.
+    """
+    SQLModel.metadata.create_all(db_engine)
+    applied = [f"added column {name}" for name in add_missing_columns(db_engine)]
+    applied += [f"created index {name}" for name in create_missing_indexes(db_engine)]
+    applied += create_search_index(db_engine)
+    return applied
+
+if __name__ == "__main__":
+    from app.database import engine
+
+    steps = run_migrations(engine)
+    for step in steps:
+        print(step)
+    print(f"Schema is up to date ({len(steps)} steps applied).")
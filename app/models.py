@@ -1,12 +1,13 @@
 # app/models.py
 from sqlmodel import Field, SQLModel, Relationship, Session
+from sqlalchemy import Index, LargeBinary, UniqueConstraint
 from datetime import datetime,date
 from typing import List, Optional
 
 from app.enums import (
     UserRole, EmployeeType, EquipmentStatus, EventType, TicketType, 
     TicketStatus, ResourceType, LicenseStatus, TaskCategory, NoveltyType,
-    ShiftDesignator
+    ShiftDesignator, RollupGranularity
 )    
 from app.schemas import EquipmentBase, TankBase, TankReadingBase,ScheduledTaskBase
 
@@ -32,7 +33,7 @@ class Position(SQLModel, table=True):
 # 1.2 ShiftGroup
 class GroupMembership(SQLModel, table=True):
     group_id: Optional[int] = Field(default=None, foreign_key="shiftgroup.id", primary_key=True)
-    employee_id: Optional[int] = Field(default=None, foreign_key="employee.id", primary_key=True)
+    employee_id: Optional[int] = Field(default=None, foreign_key="employee.id", primary_key=True, index=True)
 
 class ShiftGroup(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -98,10 +99,17 @@ class OperationalParameter(SQLModel, table=True):
 2.7 GenerationRamp
 2.8 TankReading
 2.9 OperationalReading
+2.10 ShiftReportSnapshot
+2.11 OperationalReadingRollup
+2.12 EquipmentStatusInterval
 """
 
 # 2.1 Shift
 class Shift(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_shift_status_incoming_superintendent_id", "status", "incoming_superintendent_id"),
+        Index("ix_shift_status_start_time_id", "status", "start_time", "id"),
+    )
     id: Optional[int] = Field(default = None, primary_key=True)
     start_time: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     end_time: datetime | None = Field(default = None)
@@ -115,6 +123,8 @@ class Shift(SQLModel, table=True):
     incoming_superintendent_id: Optional[int] = Field(default = None, foreign_key="user.id")
     scheduled_group_id: Optional[int] = Field(default=None, foreign_key="shiftgroup.id")
     scheduled_group: Optional[ShiftGroup] = Relationship(back_populates="shifts")
+    # Bumped on every write to the shift or its logs (see app/versioning.py).
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     
     attendance_records: List["ShiftAttendance"] = Relationship(back_populates="shift")
     status_logs: list["EquipmentStatusLog"] = Relationship(back_populates="shift")
@@ -127,7 +137,7 @@ class Shift(SQLModel, table=True):
 # 2.2 ShiftAttendance
 class ShiftAttendance(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    shift_id: int = Field(foreign_key="shift.id")
+    shift_id: int = Field(foreign_key="shift.id", index=True)
     scheduled_employee_id: int = Field(foreign_key="employee.id")
     actual_employee_id: int = Field(foreign_key="employee.id")
     position_id: int = Field(foreign_key="position.id")
@@ -148,32 +158,46 @@ class ShiftAttendance(SQLModel, table=True):
 
 # 2.3 EquipmentStatusLog    
 class EquipmentStatusLog(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_equipmentstatuslog_shift_id_timestamp", "shift_id", "timestamp"),
+        Index("ix_equipmentstatuslog_equipment_id_timestamp", "equipment_id", "timestamp"),
+    )
     id: Optional[int] = Field(default = None, primary_key=True)
     timestamp: datetime 
     status: EquipmentStatus
     reason: Optional[str] = Field(default=None)  
     
     shift_id: int = Field(foreign_key="shift.id")
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     equipment_id: int = Field(foreign_key="equipment.id")  
     shift: "Shift" = Relationship(back_populates="status_logs")
     equipment: "Equipment" = Relationship(back_populates="status_logs")
 
 # 2.4 EventLog    
 class EventLog(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_eventlog_shift_id_timestamp", "shift_id", "timestamp"),
+        Index("ix_eventlog_timestamp_event_type", "timestamp", "event_type"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     timestamp: datetime
     description: str
     event_type: EventType
     
     shift_id: int = Field(foreign_key="shift.id") 
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     shift: "Shift" = Relationship(back_populates="event_logs")  
 
 # 2.5 TaskLog
 class TaskLog(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_tasklog_shift_id_completion_time", "shift_id", "completion_time"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     completion_time: datetime
     notes: Optional[str] = None
     shift_id: int = Field(foreign_key="shift.id")        
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     user_id: int = Field(foreign_key="user.id")
     scheduled_task_id: int = Field(foreign_key="scheduledtask.id")
     shift: "Shift" = Relationship(back_populates="task_logs")
@@ -182,12 +206,17 @@ class TaskLog(SQLModel, table=True):
 
 # 2.6 NoveltyLog
 class NoveltyLog(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_noveltylog_shift_id_timestamp", "shift_id", "timestamp"),
+        Index("ix_noveltylog_novelty_type_timestamp", "novelty_type", "timestamp"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     novelty_type: NoveltyType
     description: str = Field(max_length=2000)
 
     shift_id: int = Field(foreign_key="shift.id")
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     user_id: int = Field(foreign_key="user.id")
     
     shift: "Shift" = Relationship(back_populates="novelty_logs")
@@ -195,6 +224,10 @@ class NoveltyLog(SQLModel, table=True):
 
 # 2.7 GenerationRamp
 class GenerationRamp(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_generationramp_shift_id_start_time", "shift_id", "start_time"),
+        Index("ix_generationramp_start_time", "start_time"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     cenace_operator_name: str = Field(max_length=255)
     start_time: datetime
@@ -207,6 +240,7 @@ class GenerationRamp(SQLModel, table=True):
     target_ramp_rate_mw_per_minute: float
     
     shift_id: int = Field(foreign_key="shift.id")
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     user_id: int = Field(foreign_key="user.id")
 
     shift: "Shift" = Relationship(back_populates="generation_ramps")
@@ -214,18 +248,27 @@ class GenerationRamp(SQLModel, table=True):
 
 # 2.8 TankReading
 class TankReading(TankReadingBase, table=True):
+    __table_args__ = (
+        Index("ix_tankreading_tank_id_reading_timestamp", "tank_id", "reading_timestamp"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
-    shift_id: int = Field(foreign_key="shift.id")
+    shift_id: int = Field(foreign_key="shift.id", index=True)
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     user_id: int = Field(foreign_key="user.id")
     tank: Tank = Relationship(back_populates="readings")
 
 # 2.9 OperationalReading 
 class OperationalReading(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_operationalreading_shift_id_timestamp", "shift_id", "timestamp"),
+        Index("ix_operationalreading_parameter_id_equipment_id_timestamp", "parameter_id", "equipment_id", "timestamp"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     value: float
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
     shift_id: int = Field(foreign_key="shift.id")
+    change_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}) # Shift.version of the last write
     parameter_id: int = Field(foreign_key="operationalparameter.id")
     equipment_id: int = Field(foreign_key="equipment.id")
     user_id: int = Field(foreign_key="user.id")
@@ -234,6 +277,52 @@ class OperationalReading(SQLModel, table=True):
     parameter: "OperationalParameter" = Relationship(back_populates="readings")
     equipment: "Equipment" = Relationship()
     user: "User" = Relationship()            
+
+# 2.10 ShiftReportSnapshot
+# Frozen, gzip-compressed ShiftReadWithDetails JSON of a closed shift, written at handover.
+class ShiftReportSnapshot(SQLModel, table=True):
+    shift_id: int = Field(foreign_key="shift.id", primary_key=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    content_encoding: str = Field(default="gzip", max_length=20)
+    content_digest: str = Field(max_length=64) # SHA-256 of the uncompressed JSON
+    raw_size: int
+    payload: bytes = Field(sa_type=LargeBinary)
+
+# 2.11 OperationalReadingRollup
+# Count/min/max/sum/last of the readings of one parameter on one equipment per hour, day or shift.
+# Kept up to date by app/rollups.py as readings are inserted.
+class OperationalReadingRollup(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("granularity", "parameter_id", "equipment_id", "bucket_key", name="uq_operationalreadingrollup_bucket"),
+        Index("ix_operationalreadingrollup_series", "granularity", "parameter_id", "equipment_id", "bucket_start"),
+    )
+    id: Optional[int] = Field(default=None, primary_key=True)
+    granularity: RollupGranularity
+    bucket_key: str = Field(max_length=32) # "2026-10-01T05" (hour), "2026-10-01" (day) or the shift id
+    bucket_start: datetime
+    parameter_id: int = Field(foreign_key="operationalparameter.id")
+    equipment_id: int = Field(foreign_key="equipment.id")
+    reading_count: int
+    min_value: float
+    max_value: float
+    sum_value: float
+    last_value: float
+    last_timestamp: datetime
+
+# 2.12 EquipmentStatusInterval
+# The status an equipment held from one EquipmentStatusLog until its next one (end_time is NULL
+# for the current status). Kept up to date by app/availability.py as status logs are inserted.
+class EquipmentStatusInterval(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_equipmentstatusinterval_equipment_id_start_time", "equipment_id", "start_time"),
+        Index("ix_equipmentstatusinterval_start_time", "start_time"),
+    )
+    id: Optional[int] = Field(default=None, primary_key=True)
+    equipment_id: int = Field(foreign_key="equipment.id")
+    status: EquipmentStatus
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    status_log_id: int = Field(foreign_key="equipmentstatuslog.id")
     
 """ 
 --- AUXILIARY MODULES ---
@@ -242,26 +331,35 @@ class OperationalReading(SQLModel, table=True):
 """    
 # 3.1 MaintenanceTicket    
 class MaintenanceTicket(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_maintenanceticket_created_at", "created_at"),
+        Index("ix_maintenanceticket_completed_at", "completed_at"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     description: str = Field(max_length=1000)
     impact: Optional[str]=Field(default=None, max_length=1000)
     ticket_type: TicketType
-    ticket_status: TicketStatus = Field(default=TicketStatus.OPEN)
+    ticket_status: TicketStatus = Field(default=TicketStatus.OPEN, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
     
-    equipment_id: int = Field(foreign_key="equipment.id")
+    equipment_id: int = Field(foreign_key="equipment.id", index=True)
     created_by_user_id: int = Field(foreign_key="user.id")
 
     equipment: "Equipment" = Relationship(back_populates="maintenance_tickets")
 
 # 3.2 License
 class License(SQLModel, table=True):
+    __table_args__ = (
+        # Licenses active at a time T: the planner seeks whichever bound is more selective.
+        Index("ix_license_start_time", "start_time"),
+        Index("ix_license_end_time", "end_time"),
+    )
     id: int = Field(default=None, primary_key=True)
     license_number: str = Field(unique=True, index=True)
     affected_unit: str
     description: str = Field(max_length=1000)
-    status: LicenseStatus = Field(default=LicenseStatus.ACTIVE)
+    status: LicenseStatus = Field(default=LicenseStatus.ACTIVE, index=True)
     start_time: datetime
     end_time: Optional[datetime] = None
     
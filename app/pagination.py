@@ -0,0 +1,45 @@
+# app/pagination.py
+"""
+Keyset (cursor) pagination helpers. A cursor is an opaque token holding the sort key
+of the last row of a page; the next page starts strictly after that row.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> list[Any]:
+    """
+    Decode a cursor, converting each stored value with the matching parser.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("unexpected cursor shape")
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor")
+
+def paginate(rows: Sequence[Any], limit: int, response: Response, cursor_key: Callable[[Any], tuple]) -> Sequence[Any]:
+    """
+    Trim a result fetched with limit + 1 rows to a page and, when more rows exist,
+    publish the cursor of the page's last row in the X-Next-Cursor header.
+    """
+    if len(rows) <= limit:
+        return rows
+    page = rows[:limit]
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*cursor_key(page[-1]))
+    return page
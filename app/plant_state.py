@@ -0,0 +1,84 @@
+# app/plant_state.py
+"""
+Point-in-time state of the plant: equipment status, active licenses and tank levels,
+each answered from an index rather than by replaying the logs.
+"""
+from datetime import datetime
+
+from sqlalchemy import or_
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+
+from app.availability import interval_in_force_id
+from app.models import Equipment, EquipmentStatusInterval, EquipmentStatusLog, License, Tank, TankReading
+
+def latest_tank_reading_id(as_of: datetime):
+    """
+    Correlated subquery: id of the enclosing query's Tank's last reading at or before `as_of`.
+    """
+    candidate = aliased(TankReading)
+    return (
+        select(candidate.id)
+        .where(candidate.tank_id == Tank.id)
+        .where(candidate.reading_timestamp <= as_of)
+        .order_by(candidate.reading_timestamp.desc(), candidate.id.desc())
+        .limit(1)
+        .correlate(Tank)
+        .scalar_subquery()
+    )
+
+def equipment_state_at(session: Session, as_of: datetime) -> list[dict]:
+    rows = session.exec(
+        select(
+            Equipment.id, Equipment.name, EquipmentStatusInterval.status,
+            EquipmentStatusInterval.start_time, EquipmentStatusLog.reason, EquipmentStatusInterval.status_log_id
+        )
+        .select_from(Equipment)
+        .outerjoin(EquipmentStatusInterval, EquipmentStatusInterval.id == interval_in_force_id(as_of))
+        .outerjoin(EquipmentStatusLog, EquipmentStatusLog.id == EquipmentStatusInterval.status_log_id)
+        .order_by(Equipment.id)
+    ).all()
+    return [
+        {
+            "equipment_id": equipment_id, "equipment_name": name, "status": status,
+            "since": since, "reason": reason, "status_log_id": status_log_id,
+        }
+        for equipment_id, name, status, since, reason, status_log_id in rows
+    ]
+
+def active_licenses_at(session: Session, as_of: datetime) -> list[License]:
+    return session.exec(
+        select(License)
+        .where(License.start_time <= as_of)
+        .where(or_(License.end_time.is_(None), License.end_time > as_of))
+        .order_by(License.start_time, License.id)
+    ).all()
+
+def tank_levels_at(session: Session, as_of: datetime) -> list[dict]:
+    rows = session.exec(
+        select(Tank, TankReading)
+        .select_from(Tank)
+        .outerjoin(TankReading, TankReading.id == latest_tank_reading_id(as_of))
+        .order_by(Tank.id)
+    ).all()
+    return [
+        {
+            "tank_id": tank.id,
+            "tank_name": tank.name,
+            "resource_type": tank.resource_type,
+            "capacity_liters": tank.capacity_liters,
+            "level_liters": reading.level_liters if reading else None,
+            "fill_ratio": reading.level_liters / tank.capacity_liters if reading and tank.capacity_liters else None,
+            "reading_timestamp": reading.reading_timestamp if reading else None,
+            "reading_id": reading.id if reading else None,
+        }
+        for tank, reading in rows
+    ]
+
+def plant_state(session: Session, as_of: datetime) -> dict:
+    return {
+        "as_of": as_of,
+        "equipment": equipment_state_at(session, as_of),
+        "active_licenses": active_licenses_at(session, as_of),
+        "tanks": tank_levels_at(session, as_of),
+    }
@@ -0,0 +1,137 @@
+# app/ramp_analytics.py
+"""
+Ramp-compliance analytics over GenerationRamp history, computed with NumPy over all
+ramps of a range at once and grouped per CENACE operator, user and month.
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models import GenerationRamp, User
+
+SHORTFALL_QUANTILES = np.array([0.5, 0.9, 1.0])
+
+class RampArrays(NamedTuple):
+    start_time: np.ndarray # datetime64[us]
+    duration_minutes: np.ndarray
+    initial_load_mw: np.ndarray
+    final_load_mw: np.ndarray
+    target_rate: np.ndarray
+    recorded_compliant: np.ndarray
+    operator: np.ndarray
+    username: np.ndarray
+
+def load_ramps(session: Session, start: datetime, end: datetime) -> RampArrays:
+    rows = session.exec(
+        select(
+            GenerationRamp.start_time, GenerationRamp.end_time, GenerationRamp.initial_load_mw,
+            GenerationRamp.final_load_mw, GenerationRamp.target_ramp_rate_mw_per_minute,
+            GenerationRamp.is_compliant, GenerationRamp.cenace_operator_name, User.username
+        )
+        .join(User, GenerationRamp.user_id == User.id)
+        .where(GenerationRamp.start_time >= start)
+        .where(GenerationRamp.start_time < end)
+    ).all()
+    columns = list(zip(*rows)) if rows else [()] * len(RampArrays._fields)
+    start_times = np.array(columns[0], dtype="datetime64[us]")
+    end_times = np.array(columns[1], dtype="datetime64[us]")
+    return RampArrays(
+        start_time=start_times,
+        duration_minutes=(end_times - start_times) / np.timedelta64(1, "m"),
+        initial_load_mw=np.asarray(columns[2], dtype=np.float64),
+        final_load_mw=np.asarray(columns[3], dtype=np.float64),
+        target_rate=np.asarray(columns[4], dtype=np.float64),
+        recorded_compliant=np.asarray(columns[5], dtype=bool),
+        operator=np.asarray(columns[6], dtype=object),
+        username=np.asarray(columns[7], dtype=object),
+    )
+
+def group_quantiles(groups: np.ndarray, values: np.ndarray, group_count: int) -> np.ndarray:
+    """
+    SHORTFALL_QUANTILES of `values` within each group (linear interpolation); NaN for empty groups.
+    """
+    result = np.full((group_count, len(SHORTFALL_QUANTILES)), np.nan)
+    if len(values) == 0:
+        return result
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+    counts = np.bincount(groups, minlength=group_count)
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+    positions = offsets[present, None] + SHORTFALL_QUANTILES[None, :] * (counts[present, None] - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    weight = positions - lower
+    result[present] = sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+    return result
+
+def optional(value) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+def group_stats(keys: np.ndarray, rate: np.ndarray, target: np.ndarray, evaluated: np.ndarray, compliant: np.ndarray, recorded: np.ndarray) -> list[dict]:
+    """
+    Compliance figures per distinct key, in key order.
+    """
+    if len(keys) == 0:
+        return []
+    labels, groups = np.unique(keys.astype(str), return_inverse=True)
+    group_count = len(labels)
+
+    def total(weights=None):
+        return np.bincount(groups, weights=weights, minlength=group_count)
+
+    ramps = total()
+    evaluated_count = total(evaluated)
+    compliant_count = total(compliant)
+    changed = total(evaluated & (compliant != recorded))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        compliance_ratio = compliant_count / evaluated_count
+        mean_rate = total(np.where(evaluated, rate, 0.0)) / evaluated_count
+        mean_target = total(np.where(evaluated, target, 0.0)) / evaluated_count
+
+    missed = evaluated & ~compliant
+    shortfall_quantiles = group_quantiles(groups[missed], (target - rate)[missed], group_count)
+
+    return [
+        {
+            "key": str(labels[index]),
+            "ramps": int(ramps[index]),
+            "evaluated": int(evaluated_count[index]),
+            "compliant": int(compliant_count[index]),
+            "compliance_ratio": optional(compliance_ratio[index]),
+            "mean_rate_mw_per_minute": optional(mean_rate[index]),
+            "mean_target_mw_per_minute": optional(mean_target[index]),
+            "changed_vs_recorded": int(changed[index]),
+            "shortfall_p50": optional(shortfall_quantiles[index, 0]),
+            "shortfall_p90": optional(shortfall_quantiles[index, 1]),
+            "shortfall_max": optional(shortfall_quantiles[index, 2]),
+        }
+        for index in range(group_count)
+    ]
+
+def ramp_analytics(session: Session, start: datetime, end: datetime, target_rate: Optional[float] = None) -> dict:
+    """
+    Ramp compliance over [start, end) overall, per CENACE operator, per user and per month.
+    With `target_rate`, every ramp is evaluated against it instead of its own target.
+    """
+    ramps = load_ramps(session, start, end)
+    evaluated = ramps.duration_minutes > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rate = np.where(evaluated, (ramps.final_load_mw - ramps.initial_load_mw) / ramps.duration_minutes, np.nan)
+    target = ramps.target_rate if target_rate is None else np.full(len(rate), target_rate)
+    compliant = evaluated & (np.nan_to_num(rate, nan=-np.inf) >= target)
+    columns = (rate, target, evaluated, compliant, ramps.recorded_compliant)
+
+    overall = group_stats(np.full(len(rate), "all", dtype=object), *columns)
+    months = ramps.start_time.astype("datetime64[M]").astype(str).astype(object)
+    return {
+        "start": start,
+        "end": end,
+        "target_rate_mw_per_minute": target_rate,
+        "overall": overall[0] if overall else None,
+        "by_operator": group_stats(ramps.operator, *columns),
+        "by_user": group_stats(ramps.username, *columns),
+        "by_month": group_stats(months, *columns),
+    }
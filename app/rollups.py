@@ -0,0 +1,189 @@
+# app/rollups.py
+"""
+Incremental hourly / daily / per-shift rollups of operational readings, kept in step
+by record_readings() in the same transaction as the readings.
+Rebuild with: python -m app.rollups
+"""
+from datetime import datetime, time
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import case, delete, func
+from sqlmodel import Session, select
+
+from app.enums import RollupGranularity
+from app.models import OperationalReading, OperationalReadingRollup, Shift
+from app.shift_registry import shift_registry
+
+ROLLUP_CONFLICT_COLUMNS = ["granularity", "parameter_id", "equipment_id", "bucket_key"]
+ROLLUP_UPSERT_CHUNK = 500
+REBUILD_BATCH_SIZE = 10_000
+
+class ReadingPoint(NamedTuple):
+    parameter_id: int
+    equipment_id: int
+    shift_id: int
+    shift_start: datetime
+    timestamp: datetime
+    value: float
+
+def bucket_for(granularity: RollupGranularity, point: ReadingPoint) -> tuple[str, datetime]:
+    """
+    Key and start time of the bucket a reading falls into.
+    """
+    if granularity == RollupGranularity.HOUR:
+        start = point.timestamp.replace(minute=0, second=0, microsecond=0)
+        return start.strftime("%Y-%m-%dT%H"), start
+    if granularity == RollupGranularity.DAY:
+        return point.timestamp.date().isoformat(), datetime.combine(point.timestamp.date(), time.min)
+    return str(point.shift_id), point.shift_start
+
+def aggregate_points(points: Iterable[ReadingPoint], buckets: dict | None = None) -> dict:
+    """
+    Fold readings into rollup rows keyed by (granularity, parameter_id, equipment_id, bucket_key).
+    """
+    buckets = {} if buckets is None else buckets
+    for point in points:
+        for granularity in RollupGranularity:
+            bucket_key, bucket_start = bucket_for(granularity, point)
+            key = (granularity, point.parameter_id, point.equipment_id, bucket_key)
+            row = buckets.get(key)
+            if row is None:
+                buckets[key] = {
+                    "granularity": granularity,
+                    "bucket_key": bucket_key,
+                    "bucket_start": bucket_start,
+                    "parameter_id": point.parameter_id,
+                    "equipment_id": point.equipment_id,
+                    "reading_count": 1,
+                    "min_value": point.value,
+                    "max_value": point.value,
+                    "sum_value": point.value,
+                    "last_value": point.value,
+                    "last_timestamp": point.timestamp,
+                }
+                continue
+            row["reading_count"] += 1
+            row["min_value"] = min(row["min_value"], point.value)
+            row["max_value"] = max(row["max_value"], point.value)
+            row["sum_value"] += point.value
+            if point.timestamp >= row["last_timestamp"]:
+                row["last_value"] = point.value
+                row["last_timestamp"] = point.timestamp
+    return buckets
+
+def rollup_upsert(dialect_name: str, rows: list[dict]):
+    """
+    INSERT ... ON CONFLICT statement merging `rows` into the existing rollups.
+    Returns None on dialects without ON CONFLICT support.
+    """
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        least, greatest = func.min, func.max # Two-argument min()/max() are scalar in SQLite
+    elif dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        least, greatest = func.least, func.greatest
+    else:
+        return None
+
+    table = OperationalReadingRollup.__table__
+    statement = insert(table).values(rows)
+    excluded = statement.excluded
+    return statement.on_conflict_do_update(
+        index_elements=ROLLUP_CONFLICT_COLUMNS,
+        set_={
+            "reading_count": table.c.reading_count + excluded.reading_count,
+            "min_value": least(table.c.min_value, excluded.min_value),
+            "max_value": greatest(table.c.max_value, excluded.max_value),
+            "sum_value": table.c.sum_value + excluded.sum_value,
+            # Backdated readings must not replace a more recent last value.
+            "last_value": case(
+                (excluded.last_timestamp >= table.c.last_timestamp, excluded.last_value),
+                else_=table.c.last_value,
+            ),
+            "last_timestamp": greatest(table.c.last_timestamp, excluded.last_timestamp),
+        },
+    )
+
+def merge_rollups(session: Session, buckets: dict) -> None:
+    rows = list(buckets.values())
+    dialect_name = session.get_bind().dialect.name
+    for offset in range(0, len(rows), ROLLUP_UPSERT_CHUNK):
+        chunk = rows[offset:offset + ROLLUP_UPSERT_CHUNK]
+        statement = rollup_upsert(dialect_name, chunk)
+        if statement is not None:
+            session.execute(statement)
+            continue
+        for row in chunk:
+            merge_rollup_row(session, row)
+
+def merge_rollup_row(session: Session, row: dict) -> None:
+    """
+    Portable read-modify-write fallback for dialects without ON CONFLICT.
+    """
+    existing = session.exec(
+        select(OperationalReadingRollup)
+        .where(OperationalReadingRollup.granularity == row["granularity"])
+        .where(OperationalReadingRollup.parameter_id == row["parameter_id"])
+        .where(OperationalReadingRollup.equipment_id == row["equipment_id"])
+        .where(OperationalReadingRollup.bucket_key == row["bucket_key"])
+        .with_for_update()
+    ).first()
+    if existing is None:
+        session.add(OperationalReadingRollup(**row))
+        return
+    existing.reading_count += row["reading_count"]
+    existing.min_value = min(existing.min_value, row["min_value"])
+    existing.max_value = max(existing.max_value, row["max_value"])
+    existing.sum_value += row["sum_value"]
+    if row["last_timestamp"] >= existing.last_timestamp:
+        existing.last_value = row["last_value"]
+        existing.last_timestamp = row["last_timestamp"]
+    session.add(existing)
+
+def record_readings(session: Session, readings: list[OperationalReading]) -> None:
+    """
+    Add newly inserted readings to their rollups. Call before the commit that stores them.
+    """
+    if not readings:
+        return
+    shift_starts = {
+        shift_id: shift_registry.lookup(session, shift_id).start_time
+        for shift_id in {reading.shift_id for reading in readings}
+    }
+    points = (
+        ReadingPoint(
+            reading.parameter_id, reading.equipment_id, reading.shift_id,
+            shift_starts[reading.shift_id], reading.timestamp, reading.value
+        )
+        for reading in readings
+    )
+    merge_rollups(session, aggregate_points(points))
+
+def rebuild_rollups(session: Session) -> int:
+    """
+    Recompute every rollup from the raw readings. Returns the number of rollup rows written.
+    """
+    session.execute(delete(OperationalReadingRollup))
+    statement = (
+        select(
+            OperationalReading.parameter_id, OperationalReading.equipment_id, OperationalReading.shift_id,
+            Shift.start_time, OperationalReading.timestamp, OperationalReading.value
+        )
+        .join(Shift, OperationalReading.shift_id == Shift.id)
+        .execution_options(yield_per=REBUILD_BATCH_SIZE)
+    )
+    buckets: dict = {}
+    for batch in session.exec(statement).partitions():
+        aggregate_points((ReadingPoint(*row) for row in batch), buckets)
+    merge_rollups(session, buckets)
+    session.commit()
+    return len(buckets)
+
+if __name__ == "__main__":
+    from app.database import engine
+    from app.migrations import run_migrations
+
+    run_migrations(engine)
+    with Session(engine) as session:
+        count = rebuild_rollups(session)
+    print(f"Rebuilt {count} operational reading rollups.")
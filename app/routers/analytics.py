@@ -0,0 +1,65 @@
+# app/routers/analytics.py
+"""
+Aggregated operational analytics across shifts.
+"""
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import Session
+from datetime import date, datetime
+
+from app.database import get_session
+from app.models import User
+from app.enums import KpiPeriod
+from app.schemas import RampAnalytics, OperationalKpis
+from app.routers.login import get_current_user
+from app.ramp_analytics import ramp_analytics
+from app.kpis import MAX_KPI_PERIODS, operational_kpis, period_starts
+from app.timezones import naive_utc
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["Analytics"],
+)
+
+SessionDep = Annotated[Session, Depends(get_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+@router.get("/ramps", response_model=RampAnalytics)
+def read_ramp_analytics(
+    session: SessionDep,
+    current_user: CurrentUser,
+    start: datetime = Query(description="Include ramps started at or after this time"),
+    end: datetime = Query(description="Include ramps started before this time"),
+    target_rate: Optional[float] = Query(default=None, description="Re-evaluate every ramp against this target (MW/min) instead of its own; nothing is written"),
+) -> dict:
+    """
+    Actual ramp rates, compliance ratios and shortfall distribution overall, per CENACE operator,
+    per user and per month.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+    return ramp_analytics(session, start, end, target_rate)
+
+@router.get("/kpis", response_model=List[OperationalKpis])
+def read_operational_kpis(
+    session: SessionDep,
+    current_user: CurrentUser,
+    start: date = Query(description="First day of the range"),
+    end: Optional[date] = Query(default=None, description="Last day of the range (included); defaults to today"),
+    period: KpiPeriod = Query(default=KpiPeriod.DAY, description="DAY, WEEK (starting on Monday) or MONTH"),
+) -> List[dict]:
+    """
+    Events by type, maintenance tickets opened / completed / still open, active licenses and
+    safety incidents for every period overlapping the range. Closed periods are computed once
+    and served from cache until a write lands in them.
+    """
+    end = end or datetime.utcnow().date()
+    if end < start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must not be before start")
+    if len(period_starts(start, end, period)) > MAX_KPI_PERIODS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The range spans more than {MAX_KPI_PERIODS} periods; use a longer period or a shorter range",
+        )
+    return operational_kpis(session, period, start, end)
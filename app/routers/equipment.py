@@ -1,12 +1,16 @@
 # app/routers/equipment.py
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Response
 from sqlmodel import Session, select
+from datetime import datetime
 
 from app.database import get_session
 from app.models import Equipment
-from app.schemas import EquipmentCreate, EquipmentUpdate, EquipmentRead
+from app.schemas import EquipmentCreate, EquipmentUpdate, EquipmentRead, EquipmentAvailability
 from app.dependencies import require_role, UserRole
+from app.http_cache import catalog_response
+from app.availability import equipment_availability
+from app.timezones import naive_utc
 
 router = APIRouter(
     prefix="/equipment",
@@ -25,11 +29,28 @@ def create_equipment(equipment: EquipmentCreate, session: SessionDep) -> Equipme
     
 @router.get("/", response_model=list[EquipmentRead])
 def read_equipments(
+    request: Request,
     session: SessionDep,
     offset: int = 0,
-    limit: int = Query(default=100, le=100)) -> list[Equipment]:
+    limit: int = Query(default=100, le=100)) -> Response:
     equipments = session.exec(select(Equipment).offset(offset).limit(limit)).all()
-    return equipments
+    return catalog_response(request, equipments, EquipmentRead)
+
+@router.get("/availability", response_model=List[EquipmentAvailability])
+def read_equipment_availability(
+    session: SessionDep,
+    start: datetime = Query(description="Start of the range"),
+    end: datetime = Query(description="End of the range (exclusive); the part after now is ignored"),
+    equipment_id: Optional[List[int]] = Query(default=None, description="Restrict to these equipment (repeatable)"),
+) -> List[dict]:
+    """
+    Time in each status, availability factor and forced-outage hours per equipment over a range,
+    computed from the incrementally maintained status timeline.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+    return equipment_availability(session, start, end, equipment_id)
 
 @router.get("/{equipment_id}", response_model=EquipmentRead)
 def read_equipment(equipment_id: int, session: SessionDep) -> Equipment:
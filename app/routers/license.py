@@ -1,6 +1,6 @@
 # app/routers/license.py
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, status, Query, HTTPException, Response
 from sqlmodel import Session, select
 from datetime import datetime
 
@@ -10,6 +10,7 @@ from app.models import License, User
 from app.schemas import LicenseRead, LicenseCreate, LicenseClose
 from app.routers.login import get_current_user
 from app.dependencies import require_role, UserRole
+from app.pagination import decode_cursor, paginate
 
 router = APIRouter(
     prefix="/licenses",
@@ -38,15 +39,23 @@ def create_license(
 @router.get("/", response_model=List[LicenseRead])
 def read_licenses(
     session: SessionDep,
+    response: Response,
     status: LicenseStatus | None = None,
     offset: int = 0,
-    limit: int = Query(default=100, le=100)) -> List[License]:
-    query = select(License)
+    limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from the X-Next-Cursor header of the previous page")) -> List[License]:
+    """
+    Get licenses in creation order, optionally filtered by status. Follow X-Next-Cursor for the next page.
+    """
+    query = select(License).order_by(License.id)
     if status:
         query = query.where(License.status == status)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.where(License.id > last_id)
         
-    licenses = session.exec(query.offset(offset).limit(limit)).all()
-    return licenses
+    licenses = session.exec(query.offset(offset).limit(limit + 1)).all()
+    return paginate(licenses, limit, response, lambda license: (license.id,))
 
 @router.get("/{license_id}", response_model=LicenseRead)
 def read_license(license_id: int, session: SessionDep) -> License:
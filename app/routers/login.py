@@ -1,44 +1,91 @@
 # app/routers/login.py
+import time
 from datetime import timedelta
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from jose import JWTError, jwt
 
-from app.database import get_session
+from app.cache import TTLCache
+from app.database import get_session, get_async_session
 from app.models import User 
-from app.security import ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token, verify_password, SECRET_KEY, ALGORITHM
+from app.security import (
+    ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token, verify_password, SECRET_KEY, ALGORITHM,
+    USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS
+)
 from app.schemas import UserRead
 
 router = APIRouter(tags=["Login"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 SessionDep = Annotated[Session, Depends(get_session)]
 
+# Decoded token -> detached User snapshot. Entries never outlive the token itself.
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
 
-def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    session: SessionDep
-) -> User:
-    credentials_exception = HTTPException(
+def invalidate_cached_user(username: str) -> None:
+    """
+    Drop every cached token that resolves to the given username.
+    Must be called whenever a user is created or changed.
+    """
+    user_cache.invalidate(lambda _, cached_user: cached_user.username == username)
+
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def decode_token(token: str) -> tuple[str, float]:
+    """
+    Username of a valid token and the seconds it has left.
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str | None = payload.get("sub")
         if username is None:
-            raise credentials_exception
+            raise credentials_exception()
     except JWTError:
-        raise credentials_exception
-    
-    user = session.exec(select(User).where(User.username == username)).first()   
+        raise credentials_exception()
+    return username, payload.get("exp", 0) - time.time()
+
+def remember_user(token: str, user: User | None, token_lifetime: float) -> User:
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
+    user_cache.set(token, User.model_validate(user), ttl=min(USER_CACHE_TTL_SECONDS, token_lifetime))
+    return user
+
+def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: SessionDep
+) -> User:
+    cached_user = user_cache.get(token)
+    if cached_user is not None:
+        return cached_user
     
-    return user 
+    username, token_lifetime = decode_token(token)
+    user = session.exec(select(User).where(User.username == username)).first()   
+    return remember_user(token, user, token_lifetime)
+
+async def get_current_user_async(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: Annotated[AsyncSession, Depends(get_async_session)]
+) -> User:
+    """
+    get_current_user for the async routers: runs on the event loop and queries through the AsyncSession.
+    """
+    cached_user = user_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
+    username, token_lifetime = decode_token(token)
+    user = (await session.exec(select(User).where(User.username == username))).first()
+    return remember_user(token, user, token_lifetime)
 
 @router.get("/users/me", response_model=UserRead)
 def read_users_me(
@@ -50,17 +97,18 @@ def read_users_me(
     return current_user
 
 @router.post("/token")
-def login_for_access_token(
+async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: SessionDep,
 ) -> dict[str, Any]:
     """
     Exchange username and password for a JWT access token.
+    The bcrypt check is awaited on the verification pool, so a burst of logins does not hold request threads.
     """
     statement = select(User).where(User.username == form_data.username)
-    user = session.exec(statement). first()
+    user = await run_in_threadpool(lambda: session.exec(statement).first())
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -1,6 +1,6 @@
 # app/routers/maintenance.py
-from typing import Annotated
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, status, Query, HTTPException, Response
 from sqlmodel import Session, select
 from datetime import datetime
 
@@ -10,6 +10,7 @@ from app.models import MaintenanceTicket, User
 from app.schemas import MaintenanceTicketCreate, MaintenanceTicketRead, MaintenanceTicketUpdate
 from app.routers.login import get_current_user
 from app.dependencies import require_role, UserRole
+from app.pagination import decode_cursor, paginate
 
 router = APIRouter(
     prefix="/maintenance-tickets",
@@ -38,10 +39,19 @@ def create_maintenance_ticket(
 @router.get("/", response_model=list[MaintenanceTicketRead])
 def read_maintenance_tickets(
     session: SessionDep,
+    response: Response,
     offset: int = 0,
-    limit: int = Query(default=100, le=100)) -> list[MaintenanceTicket]:
-    maintenance_tickets = session.exec(select(MaintenanceTicket).offset(offset).limit(limit)).all()
-    return maintenance_tickets
+    limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from the X-Next-Cursor header of the previous page")) -> list[MaintenanceTicket]:
+    """
+    Get maintenance tickets in creation order. Follow X-Next-Cursor for the next page.
+    """
+    query = select(MaintenanceTicket).order_by(MaintenanceTicket.id)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.where(MaintenanceTicket.id > last_id)
+    maintenance_tickets = session.exec(query.offset(offset).limit(limit + 1)).all()
+    return paginate(maintenance_tickets, limit, response, lambda ticket: (ticket.id,))
 
 @router.get("/{maintenance_ticket_id}", response_model=MaintenanceTicketRead)
 def read_maintenance_ticket(maintenance_ticket_id: int, session: SessionDep) -> MaintenanceTicket:
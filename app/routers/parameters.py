@@ -1,11 +1,12 @@
 # app/routers/parameters.py
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
 from app.database import get_session
 from app.dependencies import require_role, UserRole
 from app.enums import UserRole
+from app.http_cache import catalog_response
 from app.models import OperationalParameter, User
 from app.schemas import (
     OperationalParameterCreate,
@@ -35,17 +36,18 @@ def create_operational_parameter(
 
 @router.get("/", response_model=List[OperationalParameterRead])
 def get_all_operational_parameters(
+    request: Request,
     session: SessionDep,
     is_active: bool = True,
     offset: int = 0,
     limit: int = Query(default=100, le=100),
-):
+) -> Response:
     """
     Get a list of all defined operational parameters.
     """
     query = select(OperationalParameter).where(OperationalParameter.is_active == is_active)
     parameters = session.exec(query.offset(offset).limit(limit)).all()
-    return parameters
+    return catalog_response(request, parameters, OperationalParameterRead)
 
 @router.put("/{parameter_id}", response_model=OperationalParameterRead)
 def update_operational_parameter(
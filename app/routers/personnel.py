@@ -1,12 +1,13 @@
 # app/routers/personnel.py
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload
 
 from app.database import get_session
 from app.dependencies import require_role
 from app.enums import UserRole
+from app.http_cache import catalog_response
 from app.models import Position, Employee, ShiftGroup, User
 from app.schemas import (
     PositionCreate, PositionRead, PositionUpdate,
@@ -32,12 +33,12 @@ def create_position(position_data: PositionCreate, session: SessionDep) -> Posit
     return db_position
 
 @router.get("/positions/", response_model=List[PositionRead])
-def get_all_positions(session: SessionDep, current_user: AuthUser) -> List[Position]:
+def get_all_positions(request: Request, session: SessionDep, current_user: AuthUser) -> Response:
     """
     Get a list of all job titles / positions.
     """
     positions = session.exec(select(Position)).all()
-    return positions
+    return catalog_response(request, positions, PositionRead)
 
 @router.put("/positions/{position_id}", response_model=PositionRead)
 def update_position(
@@ -0,0 +1,34 @@
+# app/routers/plant_state.py
+"""
+What the plant looked like at a given moment, for post-trip investigations.
+"""
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from datetime import datetime
+
+from app.database import get_session
+from app.models import User
+from app.schemas import PlantState
+from app.routers.login import get_current_user
+from app.plant_state import plant_state
+from app.timezones import naive_utc
+
+router = APIRouter(
+    prefix="/plant-state",
+    tags=["Plant State"],
+)
+
+SessionDep = Annotated[Session, Depends(get_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+@router.get("/", response_model=PlantState)
+def read_plant_state(
+    session: SessionDep,
+    current_user: CurrentUser,
+    as_of: Optional[datetime] = Query(default=None, description="Moment to reconstruct; defaults to now"),
+) -> dict:
+    """
+    Status of every equipment, the licenses in force and the latest level of every tank at `as_of`.
+    """
+    return plant_state(session, naive_utc(as_of) or datetime.utcnow())
@@ -0,0 +1,157 @@
+# app/routers/readings.py
+"""
+Operational reading history across shifts, for trending and analysis.
+"""
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session, select
+from datetime import datetime
+
+from app.database import get_session
+from app.models import User, OperationalReading, OperationalReadingRollup
+from app.schemas import OperationalReadingSeries, OperationalReadingRollupRead
+from app.routers.login import get_current_user
+from app.timeseries import (
+    MAX_SERIES_BUCKETS, DEFAULT_SERIES_POINTS, auto_bucket_seconds, bucket_count, downsample
+)
+from app.enums import ColumnarFormat, RollupGranularity
+from app.exports import pyarrow, stream_readings_columnar
+from app.timezones import naive_utc
+
+router = APIRouter(
+    prefix="/operational-readings",
+    tags=["Operational Readings"],
+)
+
+SessionDep = Annotated[Session, Depends(get_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+COLUMNAR_MEDIA_TYPES = {
+    ColumnarFormat.PARQUET: "application/vnd.apache.parquet",
+    ColumnarFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
+
+@router.get(
+    "/export",
+    summary="Export operational readings as Parquet or Arrow"
+)
+def export_operational_readings(
+    current_user: CurrentUser,
+    format: ColumnarFormat = Query(default=ColumnarFormat.PARQUET, description="parquet or arrow (IPC stream)"),
+    parameter_id: Optional[int] = Query(default=None, description="Filter by operational parameter"),
+    equipment_id: Optional[int] = Query(default=None, description="Filter by equipment"),
+    start: Optional[datetime] = Query(default=None, description="Include readings taken at or after this time"),
+    end: Optional[datetime] = Query(default=None, description="Include readings taken before this time"),
+):
+    """
+    Stream the reading history, joined with parameter and equipment names, as a typed
+    columnar file ready for pandas / pyarrow. The file is written in chunks as rows
+    are fetched, so the full result is never held in memory.
+    """
+    if pyarrow is None:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Columnar export requires the pyarrow package",
+        )
+    start, end = naive_utc(start), naive_utc(end)
+    if start is not None and end is not None and end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+
+    filename = f"operational_readings.{format.value}"
+    return StreamingResponse(
+        stream_readings_columnar(format, parameter_id, equipment_id, start, end),
+        media_type=COLUMNAR_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get(
+    "/series",
+    response_model=OperationalReadingSeries,
+    summary="Downsampled time series of one parameter on one equipment"
+)
+def get_reading_series(
+    session: SessionDep,
+    current_user: CurrentUser,
+    parameter_id: int,
+    equipment_id: int,
+    start: datetime,
+    end: datetime,
+    bucket_seconds: Optional[int] = Query(default=None, ge=1, description="Bucket width; chosen from max_points when omitted"),
+    max_points: int = Query(default=DEFAULT_SERIES_POINTS, ge=1, le=MAX_SERIES_BUCKETS),
+):
+    """
+    Trend a parameter across shifts. Readings in [start, end) are grouped into
+    fixed-width buckets and reduced server-side to min / max / avg / last / count.
+    Empty buckets are left out.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+    if bucket_seconds is None:
+        bucket_seconds = auto_bucket_seconds(start, end, max_points)
+    elif bucket_count(start, end, bucket_seconds) > MAX_SERIES_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range would produce more than {MAX_SERIES_BUCKETS} buckets; use a wider bucket",
+        )
+
+    statement = (
+        select(OperationalReading.timestamp, OperationalReading.value)
+        .where(OperationalReading.parameter_id == parameter_id)
+        .where(OperationalReading.equipment_id == equipment_id)
+        .where(OperationalReading.timestamp >= start)
+        .where(OperationalReading.timestamp < end)
+        .order_by(OperationalReading.timestamp)
+    )
+    rows = session.exec(statement).all()
+    timestamps = [row[0] for row in rows]
+    values = [row[1] for row in rows]
+
+    return OperationalReadingSeries(
+        parameter_id=parameter_id,
+        equipment_id=equipment_id,
+        start=start,
+        end=end,
+        bucket_seconds=bucket_seconds,
+        points=downsample(timestamps, values, start, bucket_seconds),
+    )
+
+@router.get(
+    "/rollups",
+    response_model=List[OperationalReadingRollupRead],
+    summary="Hourly, daily or per-shift rollups of one parameter on one equipment"
+)
+def get_reading_rollups(
+    session: SessionDep,
+    current_user: CurrentUser,
+    parameter_id: int,
+    equipment_id: int,
+    granularity: RollupGranularity = RollupGranularity.HOUR,
+    start: Optional[datetime] = Query(default=None, description="Include buckets starting at or after this time"),
+    end: Optional[datetime] = Query(default=None, description="Include buckets starting before this time"),
+):
+    """
+    Read the precomputed count / min / max / avg / last of a parameter per hour,
+    day or shift, ordered by bucket start. Maintained as readings are logged.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    statement = (
+        select(OperationalReadingRollup)
+        .where(OperationalReadingRollup.granularity == granularity)
+        .where(OperationalReadingRollup.parameter_id == parameter_id)
+        .where(OperationalReadingRollup.equipment_id == equipment_id)
+        .order_by(OperationalReadingRollup.bucket_start)
+    )
+    if start is not None:
+        statement = statement.where(OperationalReadingRollup.bucket_start >= start)
+    if end is not None:
+        statement = statement.where(OperationalReadingRollup.bucket_start < end)
+
+    rollups = session.exec(statement).all()
+    return [
+        OperationalReadingRollupRead.model_validate(
+            rollup, update={"avg_value": rollup.sum_value / rollup.reading_count}
+        )
+        for rollup in rollups
+    ]
@@ -1,19 +1,22 @@
 # app/routers/reports.py
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import selectinload
-from datetime import date
+from datetime import date, datetime
 
 from app.database import get_session
-from app.models import (
-    User, Shift, TaskLog, NoveltyLog, GenerationRamp, 
-    OperationalReading
-)
+from app.models import User, Shift, ShiftReportSnapshot
 from app.schemas import ShiftReadWithDetails, ShiftReadWithGroup
 from app.routers.login import get_current_user
 from app.dependencies import require_role, UserRole
-from app.enums import ShiftDesignator
+from app.enums import ShiftDesignator, ExportFormat, ExportLogType
+from app.exports import stream_export
+from app.pagination import decode_cursor, paginate
+from app.snapshots import SHIFT_DETAIL_OPTIONS, snapshot_response, live_report_response
+from app.timezones import naive_utc
 
 router = APIRouter(
     prefix="/reports",
@@ -23,6 +26,38 @@ router = APIRouter(
 SessionDep = Annotated[Session, Depends(get_session)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
+def closed_reports_query(
+    shift_date: Optional[date],
+    designator: Optional[ShiftDesignator],
+    cursor: Optional[str],
+):
+    """
+    Closed shifts, newest first, ordered on (start_time, id) so a cursor identifies an exact position.
+    """
+    query = (
+        select(Shift)
+        .where(Shift.status == "CLOSED")
+        .options(selectinload(Shift.scheduled_group)) 
+        .order_by(Shift.start_time.desc(), Shift.id.desc()) 
+    )
+    
+    if shift_date:
+        query = query.where(Shift.shift_date == shift_date)
+    if designator:
+        query = query.where(Shift.shift_designator == designator.value)
+    if cursor:
+        last_start_time, last_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        query = query.where(
+            or_(
+                Shift.start_time < last_start_time,
+                and_(Shift.start_time == last_start_time, Shift.id < last_id),
+            )
+        )
+    return query
+
+def report_cursor_key(shift: Shift) -> tuple:
+    return (shift.start_time, shift.id)
+
 @router.get(
     "/",
     response_model=List[ShiftReadWithGroup],
@@ -31,29 +66,53 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
 def get_closed_reports(
     session: SessionDep,
     current_user: CurrentUser,
+    response: Response,
     offset: int = 0,
     limit: int = Query(default=25, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     shift_date: Optional[date] = Query(default=None, description="Filter by operational date"),
     designator: Optional[ShiftDesignator] = Query(default=None, description="Filter by shift designator (1, 2, or 3)")
 ):
     """
     Get a paginated list of all shifts that are 'CLOSED'.
     Allows filtering by operational date and shift designator.
-    """
-    query = (
-        select(Shift)
-        .where(Shift.status == "CLOSED")
-        .options(selectinload(Shift.scheduled_group)) 
-        .order_by(Shift.start_time.desc()) 
-    )
     
-    if shift_date:
-        query = query.where(Shift.shift_date == shift_date)
-    if designator:
-        query = query.where(Shift.shift_designator == designator.value)
+    Pages are chained with keyset pagination: when more results exist, the response carries
+    an X-Next-Cursor header whose value is passed back as `cursor`. `offset` is still accepted
+    but deep offsets get slower as the archive grows.
+    """
+    query = closed_reports_query(shift_date, designator, cursor)
+    reports = session.exec(query.offset(offset).limit(limit + 1)).all()
+    return paginate(reports, limit, response, report_cursor_key)
 
-    reports = session.exec(query.offset(offset).limit(limit)).all()
-    return reports
+
+@router.get(
+    "/export/{log_type}",
+    summary="Stream a bulk export of closed reports"
+)
+def export_closed_reports(
+    log_type: ExportLogType,
+    current_user: CurrentUser,
+    start: datetime = Query(description="Include shifts that started at or after this time"),
+    end: datetime = Query(description="Include shifts that started before this time"),
+    format: ExportFormat = Query(default=ExportFormat.NDJSON, description="ndjson or csv"),
+):
+    """
+    Stream every row of one log type (or the shifts themselves) belonging to the
+    closed shifts that started in [start, end), as NDJSON or CSV.
+    Memory use stays flat regardless of the size of the range.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+    
+    media_type = "text/csv" if format == ExportFormat.CSV else "application/x-ndjson"
+    filename = f"{log_type.value}_{start:%Y%m%d}_{end:%Y%m%d}.{format.value}"
+    return StreamingResponse(
+        stream_export(log_type, format, start, end),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -63,29 +122,25 @@ def get_closed_reports(
 )
 def get_closed_report_details(
     report_id: int,
+    request: Request,
     session: SessionDep,
     current_user: CurrentUser
 ):
     """
     Get the complete, detailed view of a single 'CLOSED' shift report,
     including all related logs (events, novelties, tasks, etc.).
+    
+    Reports frozen at handover are served straight from their stored snapshot.
     """
+    snapshot = session.get(ShiftReportSnapshot, report_id)
+    if snapshot:
+        return snapshot_response(snapshot, request)
+    
     statement = (
         select(Shift)
         .where(Shift.id == report_id)
         .where(Shift.status == "CLOSED") 
-        .options(
-            selectinload(Shift.scheduled_group),
-            selectinload(Shift.status_logs),
-            selectinload(Shift.event_logs),
-            selectinload(Shift.task_logs).selectinload(TaskLog.user),
-            selectinload(Shift.task_logs).selectinload(TaskLog.scheduled_task),
-            selectinload(Shift.novelty_logs).selectinload(NoveltyLog.user),
-            selectinload(Shift.generation_ramps).selectinload(GenerationRamp.user),
-            selectinload(Shift.operational_readings).selectinload(OperationalReading.parameter),
-            selectinload(Shift.operational_readings).selectinload(OperationalReading.equipment),
-            selectinload(Shift.operational_readings).selectinload(OperationalReading.user)
-        )
+        .options(*SHIFT_DETAIL_OPTIONS)
     )
     
     report = session.exec(statement).first()
@@ -96,4 +151,4 @@ def get_closed_report_details(
             detail="Closed report not found"
         )
         
-    return report
\ No newline at end of file
+    return live_report_response(report, request)
\ No newline at end of file
@@ -0,0 +1,90 @@
+# app/routers/reports_async.py
+"""
+Async versions of the report archive endpoints.
+Only mounted when DATABASE_URL selects an async driver (see app/database.py).
+"""
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import date
+
+from app.database import get_async_session
+from app.models import User, Shift, ShiftReportSnapshot
+from app.schemas import ShiftReadWithDetails, ShiftReadWithGroup
+from app.routers.login import get_current_user_async
+from app.routers.reports import closed_reports_query, report_cursor_key
+from app.pagination import paginate
+from app.snapshots import SHIFT_DETAIL_OPTIONS, snapshot_response, live_report_response
+from app.enums import ShiftDesignator
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["Reports Archive"],
+)
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+CurrentUser = Annotated[User, Depends(get_current_user_async)]
+
+@router.get(
+    "/",
+    response_model=List[ShiftReadWithGroup],
+    summary="Get List of Closed Shift Reports"
+)
+async def get_closed_reports(
+    session: AsyncSessionDep,
+    current_user: CurrentUser,
+    response: Response,
+    offset: int = 0,
+    limit: int = Query(default=25, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    shift_date: Optional[date] = Query(default=None, description="Filter by operational date"),
+    designator: Optional[ShiftDesignator] = Query(default=None, description="Filter by shift designator (1, 2, or 3)")
+):
+    """
+    Get a paginated list of all shifts that are 'CLOSED'.
+    Allows filtering by operational date and shift designator.
+    Pages are chained with the X-Next-Cursor header, as in the sync endpoint.
+    """
+    query = closed_reports_query(shift_date, designator, cursor)
+    reports = (await session.exec(query.offset(offset).limit(limit + 1))).all()
+    return paginate(reports, limit, response, report_cursor_key)
+
+
+@router.get(
+    "/{report_id}",
+    response_model=ShiftReadWithDetails,
+    summary="Get Full Details for a Single Closed Report"
+)
+async def get_closed_report_details(
+    report_id: int,
+    request: Request,
+    session: AsyncSessionDep,
+    current_user: CurrentUser
+):
+    """
+    Get the complete, detailed view of a single 'CLOSED' shift report,
+    including all related logs (events, novelties, tasks, etc.).
+
+    Reports frozen at handover are served straight from their stored snapshot.
+    """
+    snapshot = await session.get(ShiftReportSnapshot, report_id)
+    if snapshot:
+        return snapshot_response(snapshot, request)
+
+    statement = (
+        select(Shift)
+        .where(Shift.id == report_id)
+        .where(Shift.status == "CLOSED")
+        .options(*SHIFT_DETAIL_OPTIONS)
+    )
+
+    report = (await session.exec(statement)).first()
+
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Closed report not found"
+        )
+
+    return live_report_response(report, request)
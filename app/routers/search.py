@@ -0,0 +1,38 @@
+# app/routers/search.py
+"""
+Full-text search over the logbook's free text. See app/search.py for the indexes.
+"""
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.database import get_session
+from app.enums import SearchSource
+from app.models import User
+from app.schemas import SearchHit
+from app.routers.login import get_current_user
+from app.search import search
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+)
+
+SessionDep = Annotated[Session, Depends(get_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+@router.get("/", response_model=List[SearchHit])
+def search_logbook(
+    session: SessionDep,
+    current_user: CurrentUser,
+    q: str = Query(min_length=1, max_length=200, description="Words to look for; every word must appear"),
+    source: Optional[List[SearchSource]] = Query(default=None, description="Restrict to these sources (repeatable)"),
+    offset: int = 0,
+    limit: int = Query(default=25, le=100),
+) -> List[dict]:
+    """
+    Novelties, events, maintenance tickets and licenses matching `q`, most relevant first.
+    Each hit links to its shift: the shift it was logged in, or for tickets and licenses
+    the shift in progress when they were created.
+    """
+    return search(session, q, source, limit, offset)
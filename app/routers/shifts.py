@@ -1,7 +1,11 @@
 # app/routers/shifts.py
+import asyncio
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
+from sqlalchemy import update
 from sqlalchemy.orm import selectinload
 from datetime import datetime, date, timedelta
 
@@ -17,18 +21,52 @@ from app.schemas import (
     TankReadingRead, TankReadingCreate, TaskLogCreate, TaskLogReadWithDetails,
     NoveltyLogCreate, NoveltyLogReadWithUser, GenerationRampCreate, GenerationRampReadWithUser,
     OperationalReadingCreate, OperationalReadingReadWithDetails,
-    ShiftHandoverRequest, ShiftAssignGroupRequest
+    ShiftHandoverRequest, ShiftAssignGroupRequest, OperationalReadingBatchCreate, BatchResult,
+    TankReadingBatchCreate, StatusLogBatchCreate, ShiftSheetCreate, ShiftSheetResult, ShiftSheetItemError,
+    ShiftChanges
 )     
 from app.routers.login import get_current_user
-from app.dependencies import require_role, UserRole
-from app.security import verify_password
+from app.dependencies import require_role, UserRole, OpenShift
+from app.security import password_verifier
 from app.enums import ShiftDesignator
+from app.snapshots import store_report_snapshot
+from app.rollups import record_readings
+from app.availability import record_status_logs
+from app.batch import check_batch_size, existing_ids, missing_reference_errors, bulk_insert
+from app.shift_registry import ShiftState, shift_registry
+from app.shift_events import shift_event_hub, format_sse
 
 router = APIRouter(prefix="/shifts", tags=["Shifts"])
 SessionDep = Annotated[Session, Depends(get_session)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 SuperintendentUser = Annotated[User, Depends(require_role([UserRole.SHIFT_SUPERINTENDENT]))]
 
+SSE_KEEPALIVE_SECONDS = 15
+
+def apply_final_equipment_status(session: Session, entries: list[StatusLogCreate]) -> None:
+    """
+    Set each equipment to the status of its latest entry, with one UPDATE per distinct status.
+    """
+    # sorted() is stable, so for equal timestamps the entry submitted last wins.
+    final_status = {}
+    for entry in sorted(entries, key=lambda entry: entry.timestamp):
+        final_status[entry.equipment_id] = entry.status
+    ids_by_status = {}
+    for equipment_id, equipment_status in final_status.items():
+        ids_by_status.setdefault(equipment_status, []).append(equipment_id)
+    for equipment_status, ids in ids_by_status.items():
+        session.execute(update(Equipment).where(Equipment.id.in_(ids)).values(status=equipment_status))
+
+def ramp_compliance(ramp_data: GenerationRampCreate) -> bool | None:
+    """
+    Whether the actual ramp rate (MW/min) reached the target. None if the ramp has no positive duration.
+    """
+    time_delta_minutes = (ramp_data.end_time - ramp_data.start_time).total_seconds() / 60
+    if time_delta_minutes <= 0:
+        return None
+    actual_ramp_rate = (ramp_data.final_load_mw - ramp_data.initial_load_mw) / time_delta_minutes
+    return actual_ramp_rate >= ramp_data.target_ramp_rate_mw_per_minute
+
 @router.get(
     "/active/me",
     response_model=ShiftReadWithDetails,
@@ -77,7 +115,7 @@ def get_active_shift_for_user(
     summary="Atomic Shift Handover",
     dependencies= [Depends(require_role([UserRole.SHIFT_SUPERINTENDENT]))]
 )
-def handover_shift(
+async def handover_shift(
     *,
     session:SessionDep,
     handover_data: ShiftHandoverRequest,
@@ -88,27 +126,40 @@ def handover_shift(
     
     1. Validates the credentials of the Outgoing Superintendent (logged in).
     2. Validates the credentials of the Incoming Superintendent (can be the same user).
-    3. Closes the old shift.
+       Both passwords are checked concurrently.
+    3. Closes the old shift and freezes its report snapshot.
     4. Calculates the next shift date and designator (T1, T2, T3).
     5. Opens a new shift for the incoming user.
     All in a single transaction.
     """
-    if not verify_password(handover_data.outgoing_superintendent_password,current_user.hashed_password):
+    user_b_statement = select(User).where(User.username == handover_data.incoming_superintendent_username)
+    user_b = await run_in_threadpool(lambda: session.exec(user_b_statement).first())
+    
+    credentials = [(handover_data.outgoing_superintendent_password, current_user.hashed_password)]
+    if user_b:
+        credentials.append((handover_data.incoming_superintendent_password, user_b.hashed_password))
+    # Both bcrypt checks run at the same time on the verification pool; no request thread waits for them.
+    outgoing_valid, *incoming_valid = await password_verifier.verify_many(credentials)
+    
+    if not outgoing_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials for outgoing superintendent"
         )
-       
-    user_b_statement = select(User).where(User.username == handover_data.incoming_superintendent_username)
-    user_b = session.exec(user_b_statement).first()
     
-    if not user_b or not verify_password(handover_data.incoming_superintendent_password, user_b.hashed_password):
+    if not user_b or not incoming_valid[0]:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, 
             detail="Invalid credentials for incoming superintendent"
         )
 
-    shift_to_close = session.get(Shift, handover_data.shift_to_close_id)
+    return await run_in_threadpool(close_and_open_shift, session, handover_data.shift_to_close_id, current_user, user_b)
+
+def close_and_open_shift(session: Session, shift_to_close_id: int, current_user: User, user_b: User) -> Shift:
+    """
+    Close the handed-over shift and open the next one for the incoming superintendent, in one transaction.
+    """
+    shift_to_close = session.get(Shift, shift_to_close_id)
     if not shift_to_close:
         raise HTTPException(status_code=404, detail="Shift to close not found")
     if shift_to_close.status != "OPEN":
@@ -116,10 +167,6 @@ def handover_shift(
          
     if shift_to_close.incoming_superintendent_id != current_user.id:
         raise HTTPException(status_code=403, detail="You are not authorized to hand over this shift")
-    
-    new_group = session.get(ShiftGroup, handover_data.next_scheduled_group_id)
-    if not new_group:
-        raise HTTPException(status_code=404, detail="Scheduled group not found")
 
     new_shift_date: date
     new_designator_enum: ShiftDesignator
@@ -157,7 +204,12 @@ def handover_shift(
             shift_designator=new_designator_enum.value
         )
         session.add(new_shift)
+        session.flush()
+        store_report_snapshot(session, shift_to_close.id)
+        shift_states = [ShiftState.from_shift(shift_to_close), ShiftState.from_shift(new_shift)]
         session.commit() 
+        for shift_state in shift_states:
+            shift_registry.remember(shift_state)
         
         session.refresh(new_shift)
             
@@ -192,6 +244,86 @@ def read_shift(shift_id: int, session: SessionDep) -> Shift:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
     return shift
 
+# Log sections of a shift document, with the eager loads their read schemas need.
+CHANGE_SECTIONS = {
+    "status_logs": (EquipmentStatusLog, ()),
+    "event_logs": (EventLog, ()),
+    "task_logs": (TaskLog, (selectinload(TaskLog.user), selectinload(TaskLog.scheduled_task))),
+    "novelty_logs": (NoveltyLog, (selectinload(NoveltyLog.user),)),
+    "generation_ramps": (GenerationRamp, (selectinload(GenerationRamp.user),)),
+    "operational_readings": (OperationalReading, (
+        selectinload(OperationalReading.parameter),
+        selectinload(OperationalReading.equipment),
+        selectinload(OperationalReading.user),
+    )),
+    "tank_readings": (TankReading, ()),
+}
+
+@router.get("/{shift_id}/changes", response_model=ShiftChanges, summary="Rows of a shift changed since a version")
+def get_shift_changes(
+    shift_id: int,
+    session: SessionDep,
+    current_user: CurrentUser,
+    since: int = Query(default=0, ge=0, description="The `version` of the copy the client already holds"),
+):
+    """
+    Delta sync for a shift document. Returns the shift itself plus only the log rows
+    added or modified after version `since`, and the current `version` to send as
+    `since` next time. Cost is proportional to the number of changes, not to the
+    size of the shift. `since=0` returns the full document.
+    """
+    shift = session.get(Shift, shift_id)
+    if not shift:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
+
+    changes = {"shift": shift, "since": since, "version": shift.version}
+    if since == 0 or since < shift.version:
+        for section, (model, options) in CHANGE_SECTIONS.items():
+            statement = select(model).where(model.shift_id == shift_id).options(*options).order_by(model.id)
+            if since:
+                # Rows written before versioning keep change_version = 0, so only a full fetch includes them
+                statement = statement.where(model.change_version > since)
+            changes[section] = session.exec(statement).all()
+    return changes
+
+def get_shift_state(shift_id: int, session: SessionDep) -> ShiftState:
+    shift_state = shift_registry.lookup(session, shift_id)
+    if shift_state is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
+    return shift_state
+
+@router.get("/{shift_id}/stream", summary="Live feed of a shift's changes (server-sent events)")
+async def stream_shift_changes(
+    request: Request,
+    shift_state: Annotated[ShiftState, Depends(get_shift_state)],
+    current_user: CurrentUser
+):
+    """
+    Server-sent events for one shift. Each committed insert or update of the shift or
+    of one of its logs is pushed as an event named after its kind (`event`, `novelty`,
+    `operational_reading`, `status_log`, `task_log`, `ramp`, `tank_reading`, or `shift`
+    for handovers and group assignments), carrying the JSON of the matching read schema.
+    Clients patch the shift they already hold instead of reloading it; open the stream
+    before fetching the shift so no change is missed.
+    A `resync` event means changes were dropped and the shift must be fetched again.
+    """
+    async def event_stream():
+        async with shift_event_hub.subscribe(shift_state.shift_id) as queue:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    change = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(change)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.post(
     "/{shift_id}/assign-group",
     response_model=List[ShiftAttendanceReadWithDetails],
@@ -202,21 +334,15 @@ def assign_group_to_shift(
     session: SessionDep,
     shift_id: int,
     request_data: ShiftAssignGroupRequest,
-    current_user: SuperintendentUser
+    current_user: SuperintendentUser,
+    open_shift: OpenShift
 ):
     """
     Assigns a ShiftGroup to an active shift.
     This generates the ShiftAttendance sheet for the shift
     and is the responsibility of the active superintendent.
     """
-    
     db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Shift is already closed")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not authorized to modify this shift")
     if db_shift.scheduled_group_id is not None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A group has already been assigned to this shift")
 
@@ -242,12 +368,22 @@ def assign_group_to_shift(
             )
             attendance_records_to_add.append(attendance_record)
 
+        # Only one concurrent request can claim the shift; the ORM assignment below then bumps its version.
+        claimed = session.execute(
+            update(Shift)
+            .where(Shift.id == shift_id, Shift.scheduled_group_id.is_(None))
+            .values(scheduled_group_id=new_group.id)
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A group has already been assigned to this shift")
         db_shift.scheduled_group_id = new_group.id
         session.add(db_shift)
         session.add_all(attendance_records_to_add)
         session.commit()
 
         session.refresh(db_shift)
+        shift_registry.update(db_shift)
         return db_shift.attendance_records
 
     except HTTPException as http_exc:
@@ -262,19 +398,11 @@ def log_equipment_status_for_shift(
     shift_id: int,
     status_log: StatusLogCreate,
     session: SessionDep,
-    current_user: CurrentUser
+    open_shift: OpenShift
 ) -> EquipmentStatusLog:
     """
     Register a new equipment status for a specific shift.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add logs to a closed shift")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-    
     db_equipment = session.get(Equipment, status_log.equipment_id)
     if not db_equipment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found")
@@ -284,29 +412,58 @@ def log_equipment_status_for_shift(
     
     session.add(new_log_entry)
     session.add(db_equipment)
+    record_status_logs(session, [new_log_entry])
     session.commit()
     session.refresh(new_log_entry)
     
     return new_log_entry
+
+@router.post("/{shift_id}/equipment-status/batch", response_model=BatchResult, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_role([UserRole.OPS_MANAGER, UserRole.SHIFT_SUPERINTENDENT]))])
+def log_equipment_status_batch(
+    shift_id: int,
+    batch: StatusLogBatchCreate,
+    session: SessionDep,
+    open_shift: OpenShift
+):
+    """
+    Register the status of many equipment items at once, in one transaction.
+
+    Entries that reference an unknown equipment are reported in `errors`. Each
+    equipment takes the status of its latest entry, applied with one UPDATE per
+    distinct status.
+    """
+    check_batch_size(batch.entries)
+
+    equipment_ids = existing_ids(session, Equipment, (entry.equipment_id for entry in batch.entries))
+    errors = missing_reference_errors(batch.entries, [
+        ("equipment_id", equipment_ids, "Equipment not found"),
+    ])
+    rejected = {error.index for error in errors}
+    accepted = [entry for index, entry in enumerate(batch.entries) if index not in rejected]
+
+    new_log_entries = [
+        EquipmentStatusLog.model_validate(entry, update={"shift_id": shift_id})
+        for entry in accepted
+    ]
+    created_ids = bulk_insert(session, EquipmentStatusLog, new_log_entries)
+
+    apply_final_equipment_status(session, accepted)
+    record_status_logs(session, new_log_entries)
+
+    session.commit()
+
+    return BatchResult(created_ids=created_ids, errors=errors)
     
 @router.post("/{shift_id}/events/", response_model=EventLogRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_role([UserRole.OPS_MANAGER, UserRole.SHIFT_SUPERINTENDENT]))])
 def event_log_for_shift(
     shift_id: int,
     event_data: EventLogCreate,
     session: SessionDep,
-    current_user: CurrentUser
+    open_shift: OpenShift
 ) -> EventLog:
     """
     Log a new event for a specific shift.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add logs to a closed shift")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-       
     new_event_log_entry = EventLog.model_validate(event_data, update={"shift_id": shift_id})
     
     session.add(new_event_log_entry)
@@ -340,19 +497,12 @@ def create_tank_reading_for_shift(
     shift_id: int,
     tank_reading_data: TankReadingCreate,
     session: SessionDep,
+    open_shift: OpenShift,
     current_user: CurrentUser
 ) -> TankReading:
     """
     Log a new tank level reading for a specific shift.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add tank_readings to a closed shift")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-    
     db_tank = session.get(Tank, tank_reading_data.tank_id)
     if not db_tank:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tank not found")
@@ -370,24 +520,48 @@ def create_tank_reading_for_shift(
     
     return new_tank_reading
 
+@router.post("/{shift_id}/tank-readings/batch", response_model=BatchResult, status_code=status.HTTP_201_CREATED)
+def create_tank_readings_batch(
+    shift_id: int,
+    batch: TankReadingBatchCreate,
+    session: SessionDep,
+    open_shift: OpenShift,
+    current_user: CurrentUser
+):
+    """
+    Log the level of many tanks at once, in one transaction.
+    Readings that reference an unknown tank are reported in `errors`.
+    """
+    check_batch_size(batch.readings)
+
+    tank_ids = existing_ids(session, Tank, (reading.tank_id for reading in batch.readings))
+    errors = missing_reference_errors(batch.readings, [
+        ("tank_id", tank_ids, "Tank not found"),
+    ])
+    rejected = {error.index for error in errors}
+
+    update_data = {"shift_id": shift_id, "user_id": current_user.id}
+    new_tank_readings = [
+        TankReading.model_validate(reading, update=update_data)
+        for index, reading in enumerate(batch.readings)
+        if index not in rejected
+    ]
+    created_ids = bulk_insert(session, TankReading, new_tank_readings)
+    session.commit()
+
+    return BatchResult(created_ids=created_ids, errors=errors)
+
 @router.post("/{shift_id}/task-logs/", response_model=TaskLogReadWithDetails, status_code=status.HTTP_201_CREATED)
 def log_task_for_shift(
     shift_id: int,
     log_data: TaskLogCreate, 
     session: SessionDep,
+    open_shift: OpenShift,
     current_user: CurrentUser
 ):
     """
     Log the completion of a scheduled task for a specific shift.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add tasks to a closed shift")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-    
     db_scheduled_task = session.get(ScheduledTask, log_data.scheduled_task_id)
     if not db_scheduled_task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ScheduledTask not found")   
@@ -427,19 +601,12 @@ def log_novelty_for_shift(
     shift_id: int,
     novelty_data: NoveltyLogCreate,
     session: SessionDep,
+    open_shift: OpenShift,
     current_user: CurrentUser
 ):
     """
     Record a new update, instruction, or incident for a specific shift.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add novelties to a closed shift")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-    
     update_data = {
         "shift_id": shift_id,
         "user_id": current_user.id
@@ -472,29 +639,15 @@ def log_generation_ramp_for_shift(
     shift_id: int,
     ramp_data: GenerationRampCreate,
     session: SessionDep,
+    open_shift: OpenShift,
     current_user: CurrentUser
 ):
     """
     Record a new Generation ramp and automatically calculate its compliance.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot add ramps to a closed shift")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-    
-    time_delta = ramp_data.end_time - ramp_data.start_time
-    load_delta = ramp_data.final_load_mw - ramp_data.initial_load_mw
-
-    time_delta_minutes = time_delta.total_seconds() / 60
-    if time_delta_minutes <= 0:
+    is_compliant_calculated = ramp_compliance(ramp_data)
+    if is_compliant_calculated is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="End time must be after start time.")
-
-    actual_ramp_rate = load_delta / time_delta_minutes
-
-    is_compliant_calculated = actual_ramp_rate >= ramp_data.target_ramp_rate_mw_per_minute
     
     ramp_data_dict = ramp_data.model_dump()
     
@@ -531,23 +684,16 @@ def log_operational_reading_for_shift(
     shift_id: int,
     reading_data: OperationalReadingCreate,
     session: SessionDep,
+    open_shift: OpenShift,
     current_user: CurrentUser
 ):
     """
     Log a new operational parameter reading for a specific shift.
     """
-    db_shift = session.get(Shift, shift_id)
-    if not db_shift:
-        raise HTTPException(status_code=404, detail="Shift Not Found")
-    if db_shift.status != "OPEN":
-        raise HTTPException(status_code=400, detail="Readings cannot be added to a closed shift.")
-    if db_shift.incoming_superintendent_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You are not authorized to log data for this shift")
-    
     if not session.get(OperationalParameter, reading_data.parameter_id):
         raise HTTPException(status_code=404, detail="Parameter ID not found")
     if not session.get(Equipment, reading_data.equipment_id):
-        raise HTTPException(status_code=404, detail="Parameter ID not found")
+        raise HTTPException(status_code=404, detail="Equipment ID not found")
 
     if reading_data.timestamp is None:
         reading_data.timestamp = datetime.utcnow()
@@ -556,10 +702,54 @@ def log_operational_reading_for_shift(
     new_reading = OperationalReading.model_validate(reading_data, update=update_data)
 
     session.add(new_reading)
+    record_readings(session, [new_reading])
     session.commit()
     session.refresh(new_reading)
     return new_reading
 
+@router.post(
+    "/{shift_id}/operational-readings/batch",
+    response_model=BatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def log_operational_readings_batch(
+    shift_id: int,
+    batch: OperationalReadingBatchCreate,
+    session: SessionDep,
+    open_shift: OpenShift,
+    current_user: CurrentUser
+):
+    """
+    Log a whole reading round in one request and one transaction.
+
+    Parameter and equipment IDs are validated with one query each. Readings that
+    reference an unknown ID are reported in `errors` by their position in the list;
+    all the others are inserted and their IDs returned in `created_ids`, in order.
+    """
+    check_batch_size(batch.readings)
+
+    parameter_ids = existing_ids(session, OperationalParameter, (item.parameter_id for item in batch.readings))
+    equipment_ids = existing_ids(session, Equipment, (item.equipment_id for item in batch.readings))
+    errors = missing_reference_errors(batch.readings, [
+        ("parameter_id", parameter_ids, "Parameter ID not found"),
+        ("equipment_id", equipment_ids, "Equipment ID not found"),
+    ])
+    rejected = {error.index for error in errors}
+
+    now = datetime.utcnow()
+    update_data = {"shift_id": shift_id, "user_id": current_user.id}
+    new_readings = [
+        OperationalReading.model_validate(item, update={**update_data, "timestamp": item.timestamp or now})
+        for index, item in enumerate(batch.readings)
+        if index not in rejected
+    ]
+
+    created_ids = bulk_insert(session, OperationalReading, new_readings)
+    record_readings(session, new_readings)
+    session.commit()
+
+    return BatchResult(created_ids=created_ids, errors=errors)
+
 @router.get(
     "/{shift_id}/operational-readings/",
     response_model=List[OperationalReadingReadWithDetails],
@@ -570,4 +760,102 @@ def get_readings_for_shift(shift_id: int, session: SessionDep):
     """
     statement = select(OperationalReading).where(OperationalReading.shift_id == shift_id)
     readings = session.exec(statement).all()
-    return readings
\ No newline at end of file
+    return readings
+
+@router.post(
+    "/{shift_id}/sheet",
+    response_model=ShiftSheetResult,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_role([UserRole.OPS_MANAGER, UserRole.SHIFT_SUPERINTENDENT]))],
+)
+def submit_shift_sheet(
+    shift_id: int,
+    sheet: ShiftSheetCreate,
+    session: SessionDep,
+    open_shift: OpenShift,
+    current_user: CurrentUser
+):
+    """
+    Submit a whole shift sheet (equipment status, events, novelties, task logs,
+    ramps, tank and operational readings) in one request and one commit.
+
+    The shift is checked once. Every referenced ID is validated with one query per
+    table; if any item is invalid nothing is written and all problems are returned
+    together (422) with their section and position. On success the created IDs are
+    returned per section, in the submitted order.
+    """
+    sections = ShiftSheetResult.model_fields
+    for section in sections:
+        check_batch_size(getattr(sheet, section))
+
+    equipment_ids = existing_ids(
+        session, Equipment,
+        [item.equipment_id for item in sheet.equipment_status] + [item.equipment_id for item in sheet.operational_readings],
+    )
+    parameter_ids = existing_ids(session, OperationalParameter, (item.parameter_id for item in sheet.operational_readings))
+    tank_ids = existing_ids(session, Tank, (item.tank_id for item in sheet.tank_readings))
+    task_ids = existing_ids(session, ScheduledTask, (item.scheduled_task_id for item in sheet.task_logs))
+
+    reference_checks = {
+        "equipment_status": [("equipment_id", equipment_ids, "Equipment not found")],
+        "task_logs": [("scheduled_task_id", task_ids, "ScheduledTask not found")],
+        "tank_readings": [("tank_id", tank_ids, "Tank not found")],
+        "operational_readings": [
+            ("parameter_id", parameter_ids, "Parameter ID not found"),
+            ("equipment_id", equipment_ids, "Equipment ID not found"),
+        ],
+    }
+    errors = [
+        ShiftSheetItemError(section=section, index=error.index, detail=error.detail)
+        for section, checks in reference_checks.items()
+        for error in missing_reference_errors(getattr(sheet, section), checks)
+    ]
+    ramp_compliances = [ramp_compliance(ramp) for ramp in sheet.ramps]
+    errors += [
+        ShiftSheetItemError(section="ramps", index=index, detail="End time must be after start time.")
+        for index, is_compliant in enumerate(ramp_compliances)
+        if is_compliant is None
+    ]
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[error.model_dump() for error in errors],
+        )
+
+    now = datetime.utcnow()
+    shift_data = {"shift_id": shift_id}
+    user_data = {"shift_id": shift_id, "user_id": current_user.id}
+    new_readings = [
+        OperationalReading.model_validate(item, update={**user_data, "timestamp": item.timestamp or now})
+        for item in sheet.operational_readings
+    ]
+    new_status_logs = [
+        EquipmentStatusLog.model_validate(item, update=shift_data) for item in sheet.equipment_status
+    ]
+    created = {
+        "equipment_status": bulk_insert(session, EquipmentStatusLog, new_status_logs),
+        "events": bulk_insert(session, EventLog, [
+            EventLog.model_validate(item, update=shift_data) for item in sheet.events
+        ]),
+        "novelties": bulk_insert(session, NoveltyLog, [
+            NoveltyLog.model_validate(item, update={**user_data, "timestamp": item.timestamp or now})
+            for item in sheet.novelties
+        ]),
+        "task_logs": bulk_insert(session, TaskLog, [
+            TaskLog.model_validate(item, update=user_data) for item in sheet.task_logs
+        ]),
+        "ramps": bulk_insert(session, GenerationRamp, [
+            GenerationRamp(**ramp.model_dump(), is_compliant=is_compliant, **user_data)
+            for ramp, is_compliant in zip(sheet.ramps, ramp_compliances)
+        ]),
+        "tank_readings": bulk_insert(session, TankReading, [
+            TankReading.model_validate(item, update=user_data) for item in sheet.tank_readings
+        ]),
+        "operational_readings": bulk_insert(session, OperationalReading, new_readings),
+    }
+    apply_final_equipment_status(session, sheet.equipment_status)
+    record_status_logs(session, new_status_logs)
+    record_readings(session, new_readings)
+    session.commit()
+
+    return ShiftSheetResult(**created)
@@ -0,0 +1,202 @@
+# app/routers/shifts_async.py
+"""
+Async versions of the hot shift-logging endpoints. Only mounted when DATABASE_URL
+selects an async driver, ahead of app.routers.shifts. Relationships in response
+models must be eagerly loaded, since an AsyncSession cannot lazy load.
+"""
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.orm import selectinload
+from datetime import datetime
+
+from app.database import get_async_session
+from app.models import (
+    Shift, EquipmentStatusLog, Equipment, EventLog, User, NoveltyLog,
+    OperationalReading, OperationalParameter
+)
+from app.schemas import (
+    StatusLogCreate, StatusLogRead, ShiftReadWithDetails, EventLogCreate, EventLogRead,
+    NoveltyLogCreate, NoveltyLogReadWithUser,
+    OperationalReadingCreate, OperationalReadingReadWithDetails
+)
+from app.routers.login import get_current_user_async
+from app.snapshots import SHIFT_DETAIL_OPTIONS
+from app.dependencies import require_role_async, UserRole, OpenShiftAsync
+from app.rollups import record_readings
+from app.availability import record_status_logs
+
+router = APIRouter(prefix="/shifts", tags=["Shifts"])
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+CurrentUser = Annotated[User, Depends(get_current_user_async)]
+
+@router.get(
+    "/active/me",
+    response_model=ShiftReadWithDetails,
+    summary="Get the current user's active shift",
+    dependencies=[Depends(require_role_async([UserRole.SHIFT_SUPERINTENDENT, UserRole.OPS_MANAGER]))],
+)
+async def get_active_shift_for_user(
+    *,
+    session: AsyncSessionDep,
+    current_user: CurrentUser
+) -> Shift:
+    """
+    Get the single "OPEN" shift currently assigned to the authenticated user.
+
+    This endpoint is accessible by both SHIFT_SUPERINTENDENT and OPS_MANAGER
+    to check if they have an active shift assignment.
+    """
+    statement = (
+        select(Shift)
+        .where(Shift.status == "OPEN")
+        .where(Shift.incoming_superintendent_id == current_user.id)
+        .options(*SHIFT_DETAIL_OPTIONS)
+    )
+
+    active_shift = (await session.exec(statement)).first()
+
+    if not active_shift:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active shift found for this user.",
+        )
+
+    return active_shift
+
+@router.get("/{shift_id}", response_model=ShiftReadWithDetails)
+async def read_shift(shift_id: int, session: AsyncSessionDep) -> Shift:
+    """
+    Get the details of a shift, including all its status records.
+    """
+    statement = (
+        select(Shift)
+        .where(Shift.id==shift_id)
+        .options(*SHIFT_DETAIL_OPTIONS)
+    )
+
+    shift = (await session.exec(statement)).first()
+
+    if not shift:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shift not found")
+    return shift
+
+@router.post("/{shift_id}/equipment-status/", response_model=StatusLogRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_role_async([UserRole.OPS_MANAGER, UserRole.SHIFT_SUPERINTENDENT]))])
+async def log_equipment_status_for_shift(
+    shift_id: int,
+    status_log: StatusLogCreate,
+    session: AsyncSessionDep,
+    open_shift: OpenShiftAsync
+) -> EquipmentStatusLog:
+    """
+    Register a new equipment status for a specific shift.
+    """
+    db_equipment = await session.get(Equipment, status_log.equipment_id)
+    if not db_equipment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found")
+
+    new_log_entry = EquipmentStatusLog.model_validate(status_log, update={"shift_id": shift_id})
+    db_equipment.status = new_log_entry.status
+
+    session.add(new_log_entry)
+    session.add(db_equipment)
+    await session.run_sync(record_status_logs, [new_log_entry])
+    await session.commit()
+    await session.refresh(new_log_entry)
+
+    return new_log_entry
+
+@router.post("/{shift_id}/events/", response_model=EventLogRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_role_async([UserRole.OPS_MANAGER, UserRole.SHIFT_SUPERINTENDENT]))])
+async def event_log_for_shift(
+    shift_id: int,
+    event_data: EventLogCreate,
+    session: AsyncSessionDep,
+    open_shift: OpenShiftAsync
+) -> EventLog:
+    """
+    Log a new event for a specific shift.
+    """
+    new_event_log_entry = EventLog.model_validate(event_data, update={"shift_id": shift_id})
+
+    session.add(new_event_log_entry)
+    await session.commit()
+    await session.refresh(new_event_log_entry)
+
+    return new_event_log_entry
+
+@router.post("/{shift_id}/novelties/", response_model=NoveltyLogReadWithUser, status_code=status.HTTP_201_CREATED)
+async def log_novelty_for_shift(
+    shift_id: int,
+    novelty_data: NoveltyLogCreate,
+    session: AsyncSessionDep,
+    open_shift: OpenShiftAsync,
+    current_user: CurrentUser
+):
+    """
+    Record a new update, instruction, or incident for a specific shift.
+    """
+    if novelty_data.timestamp is None:
+        novelty_data.timestamp = datetime.utcnow()
+
+    new_novelty_log = NoveltyLog.model_validate(
+        novelty_data, update={"shift_id": shift_id, "user_id": current_user.id}
+    )
+
+    session.add(new_novelty_log)
+    await session.commit()
+    await session.refresh(new_novelty_log, attribute_names=["user"])
+
+    return new_novelty_log
+
+@router.post(
+    "/{shift_id}/operational-readings/",
+    response_model=OperationalReadingReadWithDetails,
+    status_code=status.HTTP_201_CREATED,
+)
+async def log_operational_reading_for_shift(
+    shift_id: int,
+    reading_data: OperationalReadingCreate,
+    session: AsyncSessionDep,
+    open_shift: OpenShiftAsync,
+    current_user: CurrentUser
+):
+    """
+    Log a new operational parameter reading for a specific shift.
+    """
+    if not await session.get(OperationalParameter, reading_data.parameter_id):
+        raise HTTPException(status_code=404, detail="Parameter ID not found")
+    if not await session.get(Equipment, reading_data.equipment_id):
+        raise HTTPException(status_code=404, detail="Equipment ID not found")
+
+    if reading_data.timestamp is None:
+        reading_data.timestamp = datetime.utcnow()
+
+    update_data = {"shift_id": shift_id, "user_id": current_user.id}
+    new_reading = OperationalReading.model_validate(reading_data, update=update_data)
+
+    session.add(new_reading)
+    await session.run_sync(record_readings, [new_reading])
+    await session.commit()
+    await session.refresh(new_reading, attribute_names=["parameter", "equipment", "user"])
+    return new_reading
+
+@router.get(
+    "/{shift_id}/operational-readings/",
+    response_model=List[OperationalReadingReadWithDetails],
+)
+async def get_readings_for_shift(shift_id: int, session: AsyncSessionDep):
+    """
+    Get all operational parameter readings recorded in a shift.
+    """
+    statement = (
+        select(OperationalReading)
+        .where(OperationalReading.shift_id == shift_id)
+        .options(
+            selectinload(OperationalReading.parameter),
+            selectinload(OperationalReading.equipment),
+            selectinload(OperationalReading.user),
+        )
+    )
+    readings = await session.exec(statement)
+    return readings.all()
@@ -0,0 +1,30 @@
+# app/routers/system.py
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.database import engine, async_engine, pool_stats
+from app.dependencies import require_role, UserRole
+from app.security import password_verifier
+
+router = APIRouter(
+    prefix="/system",
+    tags=["System"],
+    dependencies=[Depends(require_role([UserRole.OPS_MANAGER]))],
+)
+
+@router.get("/password-hashing", summary="Password verification pool statistics")
+def get_password_hashing_stats() -> dict[str, Any]:
+    """
+    Report the size and load of the bcrypt verification pool and its observed latency.
+    """
+    return password_verifier.stats()
+
+@router.get("/database-pool", summary="Database connection pool statistics")
+def get_database_pool_stats() -> dict[str, Any]:
+    """
+    Report the connection pool usage of the sync engine and, in async mode, of the async engine.
+    """
+    stats = {"dialect": engine.dialect.name, "sync": pool_stats(engine)}
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.sync_engine)
+    return stats
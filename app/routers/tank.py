@@ -1,13 +1,15 @@
 # app/routers/tank.py
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Response
 from sqlmodel import Session, select
 
 from app.database import get_session
 from app.models import Tank
-from app.schemas import TankCreate, TankRead, TankUpdate
+from app.schemas import TankCreate, TankRead, TankUpdate, TankForecast
 from app.dependencies import require_role
 from app.enums import UserRole
+from app.http_cache import catalog_response
+from app.tank_forecast import forecast_cache, tank_forecast
 
 router = APIRouter(
     prefix="/tank",
@@ -27,11 +29,20 @@ def create_tank(tank: TankCreate, session: SessionDep) -> Tank:
         
 @router.get("/", response_model=list[TankRead])
 def read_tanks(
+    request: Request,
     session: SessionDep,
     offset: int = 0,
-    limit: int = Query(default=100, le=100)) -> list[Tank]:
+    limit: int = Query(default=100, le=100)) -> Response:
     tanks = session.exec(select(Tank).offset(offset).limit(limit)).all()
-    return tanks
+    return catalog_response(request, tanks, TankRead)
+
+@router.get("/forecast", response_model=list[TankForecast])
+def read_tank_forecasts(session: SessionDep) -> list[dict]:
+    """
+    Consumption rate and days of autonomy of every tank, for the plant-wide dashboard.
+    """
+    tanks = session.exec(select(Tank).order_by(Tank.id)).all()
+    return [tank_forecast(session, tank) for tank in tanks]
 
 @router.get("/{tank_id}", response_model=TankRead)
 def read_tank(tank_id: int, session: SessionDep) -> Tank:
@@ -40,6 +51,16 @@ def read_tank(tank_id: int, session: SessionDep) -> Tank:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tank not found")
     return tank 
  
+@router.get("/{tank_id}/forecast", response_model=TankForecast)
+def read_tank_forecast(tank_id: int, session: SessionDep) -> dict:
+    """
+    Consumption rate (linear fit over the readings since the last refill) and days of autonomy of a tank.
+    """
+    tank = session.get(Tank, tank_id)
+    if not tank:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tank not found")
+    return tank_forecast(session, tank)
+
 @router.delete("/{tank_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_role(UserRole.OPS_MANAGER))])
 def delete_tank(tank_id: int, session: SessionDep):
     tank = session.get(Tank, tank_id)
@@ -67,5 +88,6 @@ def update_tank(
     session.add(db_tank)
     session.commit()
     session.refresh(db_tank)
+    forecast_cache.pop(tank_id) # Refill detection depends on the capacity
     
     return db_tank    
@@ -1,11 +1,12 @@
 # app/routers/tasks.py
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlmodel import Session, select
 
 from app.database import get_session
 from app.dependencies import require_role
 from app.enums import UserRole
+from app.http_cache import catalog_response
 from app.models import ScheduledTask, User
 from app.schemas import ScheduledTaskCreate, ScheduledTaskRead, ScheduledTaskUpdate 
 from app.routers.login import get_current_user
@@ -38,18 +39,19 @@ def create_scheduled_task(
 @router.get("/", response_model=list[ScheduledTaskRead])
 def get_all_scheduled_tasks(
     *,
+    request: Request,
     session: SessionDep,
     offset: int = 0,
     limit: int = Query(default=100, le=100),
     is_active: bool = True
-):
+) -> Response:
     """
     Get a list of scheduled tasks; by default, only active ones.
     """
     query = select(ScheduledTask).where(ScheduledTask.is_active == is_active)
         
     scheduled_tasks = session.exec(query.offset(offset).limit(limit)).all()
-    return scheduled_tasks
+    return catalog_response(request, scheduled_tasks, ScheduledTaskRead)
 
 @router.put("/{task_id}", response_model=ScheduledTaskRead)
 def update_scheduled_task(
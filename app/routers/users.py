@@ -8,6 +8,7 @@ from app.models import User
 from app.schemas import UserCreate, UserRead
 from app.security import get_password_hash
 from app.dependencies import require_role
+from app.routers.login import invalidate_cached_user
 from app.enums import UserRole
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -30,5 +31,6 @@ def create_user(user_create: UserCreate, session: SessionDep) -> User:
     session.add(db_user)
     session.commit()
     session.refresh(db_user)
+    invalidate_cached_user(db_user.username)
     
     return db_user
@@ -6,7 +6,7 @@ from typing import List, Optional
 from app.enums import (
     UserRole, EmployeeType, EquipmentStatus, EventType, TicketType, 
     TicketStatus, LicenseStatus, TaskCategory, NoveltyType, ResourceType,
-    ShiftDesignator
+    ShiftDesignator, RollupGranularity, SearchSource, KpiPeriod
 )    
 
 """ 
@@ -179,6 +179,7 @@ class ShiftRead(SQLModel):
     outgoing_superintendent_id: int | None = None
     incoming_superintendent_id: int | None = None
     scheduled_group_id: int | None = None
+    version: int = 0
 
 class ShiftReadWithGroup(ShiftRead):
     scheduled_group: ShiftGroupRead | None = None
@@ -329,6 +330,35 @@ class OperationalReadingReadWithDetails(OperationalReadingRead):
     parameter: OperationalParameterRead
     equipment: EquipmentRead
     user: UserRead
+
+class SeriesPoint(SQLModel):
+    bucket_start: datetime
+    min: float
+    max: float
+    avg: float
+    last: float
+    count: int
+
+class OperationalReadingSeries(SQLModel):
+    parameter_id: int
+    equipment_id: int
+    start: datetime
+    end: datetime
+    bucket_seconds: int
+    points: List[SeriesPoint] = []
+
+class OperationalReadingRollupRead(SQLModel):
+    granularity: RollupGranularity
+    bucket_key: str
+    bucket_start: datetime
+    parameter_id: int
+    equipment_id: int
+    reading_count: int
+    min_value: float
+    max_value: float
+    avg_value: float
+    last_value: float
+    last_timestamp: datetime
         
 """ 
 --- AUXILIARY MODULES ---
@@ -389,4 +419,150 @@ class ShiftReadWithDetails(ShiftReadWithGroup):
     task_logs: list[TaskLogReadWithDetails] = []
     novelty_logs: list[NoveltyLogReadWithUser] = []   
     generation_ramps: list[GenerationRampReadWithUser] = [] 
-    operational_readings: list[OperationalReadingReadWithDetails] = []
\ No newline at end of file
+    operational_readings: list[OperationalReadingReadWithDetails] = []
+
+class ShiftChanges(SQLModel):
+    shift: ShiftReadWithGroup
+    since: int
+    version: int # Pass as `since` on the next request
+    status_logs: List[StatusLogRead] = []
+    event_logs: List[EventLogRead] = []
+    task_logs: list[TaskLogReadWithDetails] = []
+    novelty_logs: list[NoveltyLogReadWithUser] = []
+    generation_ramps: list[GenerationRampReadWithUser] = []
+    operational_readings: list[OperationalReadingReadWithDetails] = []
+    tank_readings: list[TankReadingRead] = []
+"""
+BATCH SCHEMAS
+"""
+class BatchItemError(SQLModel):
+    index: int # Position of the rejected item in the submitted list
+    detail: str
+
+class BatchResult(SQLModel):
+    created_ids: List[int] = []
+    errors: List[BatchItemError] = []
+
+class OperationalReadingBatchCreate(SQLModel):
+    readings: List[OperationalReadingCreate]
+
+class TankReadingBatchCreate(SQLModel):
+    readings: List[TankReadingCreate]
+
+class StatusLogBatchCreate(SQLModel):
+    entries: List[StatusLogCreate]
+
+class ShiftSheetCreate(SQLModel):
+    equipment_status: List[StatusLogCreate] = []
+    events: List[EventLogCreate] = []
+    novelties: List[NoveltyLogCreate] = []
+    task_logs: List[TaskLogCreate] = []
+    ramps: List[GenerationRampCreate] = []
+    tank_readings: List[TankReadingCreate] = []
+    operational_readings: List[OperationalReadingCreate] = []
+
+class ShiftSheetResult(SQLModel):
+    equipment_status: List[int] = []
+    events: List[int] = []
+    novelties: List[int] = []
+    task_logs: List[int] = []
+    ramps: List[int] = []
+    tank_readings: List[int] = []
+    operational_readings: List[int] = []
+
+class ShiftSheetItemError(BatchItemError):
+    section: str
+"""
+SEARCH SCHEMAS
+"""
+class SearchHit(SQLModel):
+    source: SearchSource
+    id: int
+    shift_id: Optional[int] = None # Shift the entry was written in (for tickets and licenses: the shift in progress when created)
+    timestamp: datetime
+    snippet: str
+    rank: float # Higher is more relevant
+"""
+ANALYTICS SCHEMAS
+"""
+class EquipmentAvailability(SQLModel):
+    equipment_id: int
+    equipment_name: str
+    period_hours: float # Requested range, up to now
+    unknown_hours: float # Before the equipment's first status log
+    hours_in_state: dict[EquipmentStatus, float]
+    available_hours: float # IN_SERVICE + AVAILABLE
+    availability_factor: Optional[float] = None # available_hours / known hours
+    out_of_service_hours: float
+    forced_outage_hours: float # Out of service while a fault report ticket was open
+
+class EquipmentStateAt(SQLModel):
+    equipment_id: int
+    equipment_name: str
+    status: Optional[EquipmentStatus] = None # None: no status logged before as_of
+    since: Optional[datetime] = None
+    reason: Optional[str] = None
+    status_log_id: Optional[int] = None
+
+class TankLevelAt(SQLModel):
+    tank_id: int
+    tank_name: str
+    resource_type: ResourceType
+    capacity_liters: float
+    level_liters: Optional[float] = None # None: no reading before as_of
+    fill_ratio: Optional[float] = None
+    reading_timestamp: Optional[datetime] = None
+    reading_id: Optional[int] = None
+
+class PlantState(SQLModel):
+    as_of: datetime
+    equipment: List[EquipmentStateAt] = []
+    active_licenses: List[LicenseRead] = []
+    tanks: List[TankLevelAt] = []
+
+class RampGroupStats(SQLModel):
+    key: str # CENACE operator, username or month ("2026-10")
+    ramps: int
+    evaluated: int # Ramps with a positive duration
+    compliant: int
+    compliance_ratio: Optional[float] = None
+    mean_rate_mw_per_minute: Optional[float] = None
+    mean_target_mw_per_minute: Optional[float] = None
+    changed_vs_recorded: int # Evaluated ramps whose compliance differs from the stored is_compliant
+    shortfall_p50: Optional[float] = None # MW/min below target, over non-compliant ramps
+    shortfall_p90: Optional[float] = None
+    shortfall_max: Optional[float] = None
+
+class RampAnalytics(SQLModel):
+    start: datetime
+    end: datetime
+    target_rate_mw_per_minute: Optional[float] = None # Hypothetical target, when given
+    overall: Optional[RampGroupStats] = None
+    by_operator: List[RampGroupStats] = []
+    by_user: List[RampGroupStats] = []
+    by_month: List[RampGroupStats] = []
+
+class TankForecast(SQLModel):
+    tank_id: int
+    tank_name: str
+    resource_type: ResourceType
+    capacity_liters: float
+    level_liters: Optional[float] = None # Latest reading
+    reading_timestamp: Optional[datetime] = None
+    readings_used: int # Readings since the last refill that the model was fitted on
+    consumption_liters_per_day: Optional[float] = None # Negative while the level is rising
+    r_squared: Optional[float] = None
+    days_of_autonomy: Optional[float] = None # From the latest reading, at the fitted rate
+    projected_empty_at: Optional[datetime] = None
+
+class OperationalKpis(SQLModel):
+    period: KpiPeriod
+    period_start: date
+    period_end: date # Exclusive
+    closed: bool # The period is over; its figures only change with backdated writes
+    events: dict[EventType, int]
+    tickets_opened: int
+    tickets_completed: int
+    tickets_open_at_end: int
+    active_licenses: int # In force at any time during the period
+    safety_incidents: int
@@ -0,0 +1,253 @@
+# app/search.py
+"""
+Full-text search over novelties, events, maintenance tickets and licenses.
+SQLite uses one FTS5 table kept in sync by triggers (LIKE scans without FTS5);
+PostgreSQL uses a GIN index on the tsvector of each source table.
+"""
+import os
+import re
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy import and_, bindparam, func, literal, literal_column, null, or_, text, union_all
+from sqlmodel import Session, select
+
+from app.enums import SearchSource
+from app.models import NoveltyLog, EventLog, MaintenanceTicket, License, Shift
+
+SEARCH_TABLE = "search_index"
+SEARCH_TEXT_CONFIG = os.getenv("SEARCH_TEXT_CONFIG", "simple")
+SNIPPET_TOKENS = 16
+SNIPPET_FALLBACK_CHARS = 200
+ROWID_STRIDE = 8 # search_index.rowid = source id * ROWID_STRIDE + source code
+
+class SearchSourceSpec(NamedTuple):
+    code: int
+    model: type
+    text_columns: tuple[str, ...]
+    timestamp: str
+    shift_id: Optional[str] # None: the shift is resolved from the timestamp
+
+SEARCH_SOURCES = {
+    SearchSource.NOVELTY: SearchSourceSpec(1, NoveltyLog, ("description",), "timestamp", "shift_id"),
+    SearchSource.EVENT: SearchSourceSpec(2, EventLog, ("description",), "timestamp", "shift_id"),
+    SearchSource.MAINTENANCE_TICKET: SearchSourceSpec(3, MaintenanceTicket, ("description", "impact"), "created_at", None),
+    SearchSource.LICENSE: SearchSourceSpec(4, License, ("description",), "start_time", None),
+}
+SOURCES_BY_CODE = {spec.code: source for source, spec in SEARCH_SOURCES.items()}
+
+def search_terms(query: str) -> list[str]:
+    return re.findall(r"\w+", query.lower())
+
+def text_sql(spec: SearchSourceSpec, row: Optional[str] = None) -> str:
+    prefix = f"{row}." if row else ""
+    return " || ' ' || ".join(f"coalesce({prefix}{column}, '')" for column in spec.text_columns)
+
+def tsvector_sql(spec: SearchSourceSpec, row: Optional[str] = None) -> str:
+    return f"to_tsvector('{SEARCH_TEXT_CONFIG}'::regconfig, {text_sql(spec, row)})"
+
+def rowid_sql(spec: SearchSourceSpec, row: str) -> str:
+    return f"{row}.id * {ROWID_STRIDE} + {spec.code}"
+
+def sqlite_triggers(spec: SearchSourceSpec) -> list[tuple[str, str]]:
+    table = spec.model.__tablename__
+    insert = f"INSERT INTO {SEARCH_TABLE}(rowid, body) VALUES ({rowid_sql(spec, 'new')}, {text_sql(spec, 'new')});"
+    delete = f"DELETE FROM {SEARCH_TABLE} WHERE rowid = {rowid_sql(spec, 'old')};"
+    columns = ", ".join(spec.text_columns)
+    return [
+        (f"{table}_search_insert", f"AFTER INSERT ON {table} BEGIN {insert} END"),
+        (f"{table}_search_update", f"AFTER UPDATE OF {columns} ON {table} BEGIN {delete} {insert} END"),
+        (f"{table}_search_delete", f"AFTER DELETE ON {table} BEGIN {delete} END"),
+    ]
+
+def fts5_available(connection) -> bool:
+    return "ENABLE_FTS5" in set(connection.exec_driver_sql("PRAGMA compile_options").scalars())
+
+def create_sqlite_search_index(connection) -> list[str]:
+    applied = []
+    if not search_index_exists(connection):
+        if not fts5_available(connection):
+            return applied
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(body, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        for spec in SEARCH_SOURCES.values():
+            connection.exec_driver_sql(
+                f"INSERT INTO {SEARCH_TABLE}(rowid, body) "
+                f"SELECT {rowid_sql(spec, 'source')}, {text_sql(spec, 'source')} FROM {spec.model.__tablename__} AS source"
+            )
+        applied.append(f"created search index {SEARCH_TABLE}")
+    existing_triggers = set(connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").scalars())
+    for spec in SEARCH_SOURCES.values():
+        for name, body in sqlite_triggers(spec):
+            if name not in existing_triggers:
+                connection.exec_driver_sql(f"CREATE TRIGGER {name} {body}")
+                applied.append(f"created trigger {name}")
+    return applied
+
+def create_postgresql_search_index(connection) -> list[str]:
+    applied = []
+    for spec in SEARCH_SOURCES.values():
+        table = spec.model.__tablename__
+        name = f"ix_{table}_fts"
+        if connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is None:
+            connection.exec_driver_sql(f"CREATE INDEX {name} ON {table} USING gin ({tsvector_sql(spec)})")
+            applied.append(f"created index {name}")
+    return applied
+
+def create_search_index(db_engine) -> list[str]:
+    """
+    Create (and backfill) the full-text index of the current backend. Idempotent.
+    """
+    with db_engine.begin() as connection:
+        if connection.dialect.name == "sqlite":
+            return create_sqlite_search_index(connection)
+        if connection.dialect.name == "postgresql":
+            return create_postgresql_search_index(connection)
+    return []
+
+def search_index_exists(connection) -> bool:
+    return connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,)
+    ).first() is not None
+
+def search_fts5(session: Session, terms: list[str], sources: list[SearchSource], limit: int, offset: int) -> list[tuple]:
+    """
+    (source, id, snippet, rank) of the best matches in the FTS5 index.
+    """
+    statement = (
+        f"SELECT rowid, rank, snippet({SEARCH_TABLE}, 0, '[', ']', '…', {SNIPPET_TOKENS}) FROM {SEARCH_TABLE} "
+        f"WHERE {SEARCH_TABLE} MATCH :match"
+    )
+    params = {"match": " ".join(f'"{term}"' for term in terms), "limit": limit, "offset": offset}
+    if len(sources) < len(SEARCH_SOURCES):
+        statement += f" AND rowid % {ROWID_STRIDE} IN :codes"
+        params["codes"] = [SEARCH_SOURCES[source].code for source in sources]
+    statement = text(f"{statement} ORDER BY rank, rowid LIMIT :limit OFFSET :offset")
+    if "codes" in params:
+        statement = statement.bindparams(bindparam("codes", expanding=True))
+    return [
+        # bm25 ranks are negative, best first; flip them so that higher is better.
+        (SOURCES_BY_CODE[rowid % ROWID_STRIDE], rowid // ROWID_STRIDE, snippet, -rank)
+        for rowid, rank, snippet in session.execute(statement, params)
+    ]
+
+def source_select(source: SearchSource, condition, rank):
+    """
+    (source, id, body, rank) of the rows of one source matching `condition`.
+    `condition` and `rank` build expressions from the source spec and its table name.
+    """
+    spec = SEARCH_SOURCES[source]
+    table = spec.model.__tablename__
+    return (
+        select(
+            literal(source.value).label("source"),
+            spec.model.id.label("id"),
+            literal_column(text_sql(spec, table)).label("body"),
+            rank(spec, table).label("rank"),
+        )
+        .select_from(spec.model)
+        .where(condition(spec, table))
+    )
+
+def search_tsvector(session: Session, terms: list[str], sources: list[SearchSource], limit: int, offset: int) -> list[tuple]:
+    """
+    (source, id, snippet, rank) of the best matches, answered from the GIN indexes.
+    """
+    config = literal_column(f"'{SEARCH_TEXT_CONFIG}'::regconfig")
+    tsquery = func.plainto_tsquery(config, " ".join(terms))
+    matches = union_all(*(
+        source_select(
+            source,
+            lambda spec, table: literal_column(tsvector_sql(spec, table)).bool_op("@@")(tsquery),
+            lambda spec, table: func.ts_rank(literal_column(tsvector_sql(spec, table)), tsquery),
+        )
+        for source in sources
+    )).subquery()
+    page = (
+        select(matches)
+        .order_by(matches.c.rank.desc(), matches.c.source, matches.c.id)
+        .limit(limit)
+        .offset(offset)
+        .subquery()
+    )
+    # ts_headline re-parses the text, so it only runs on the rows of the page.
+    headline = func.ts_headline(
+        config, page.c.body, tsquery,
+        f"StartSel=[, StopSel=], MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}"
+    )
+    rows = session.execute(
+        select(page.c.source, page.c.id, headline, page.c.rank).order_by(page.c.rank.desc(), page.c.source, page.c.id)
+    )
+    return [(SearchSource(source), id, snippet, rank) for source, id, snippet, rank in rows]
+
+def search_like(session: Session, terms: list[str], sources: list[SearchSource], limit: int, offset: int) -> list[tuple]:
+    """
+    Unranked LIKE scan, newest first, for SQLite builds without FTS5.
+    """
+    def condition(spec, table):
+        return and_(*(
+            or_(*(getattr(spec.model, column).ilike(f"%{term}%") for column in spec.text_columns))
+            for term in terms
+        ))
+
+    matches = union_all(*(
+        source_select(source, condition, lambda spec, table: literal(0.0)).add_columns(
+            getattr(SEARCH_SOURCES[source].model, SEARCH_SOURCES[source].timestamp).label("timestamp")
+        )
+        for source in sources
+    )).subquery()
+    rows = session.execute(
+        select(matches.c.source, matches.c.id, matches.c.body, matches.c.rank)
+        .order_by(matches.c.timestamp.desc(), matches.c.source, matches.c.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    return [(SearchSource(source), id, body[:SNIPPET_FALLBACK_CHARS], rank) for source, id, body, rank in rows]
+
+def shift_at(session: Session, timestamp: datetime) -> Optional[int]:
+    """
+    Id of the last shift started at or before `timestamp`.
+    """
+    return session.exec(
+        select(Shift.id).where(Shift.start_time <= timestamp).order_by(Shift.start_time.desc()).limit(1)
+    ).first()
+
+def search(session: Session, query: str, sources: list[SearchSource], limit: int, offset: int) -> list[dict]:
+    """
+    Ranked page of hits for `query`, each linked to the shift it was written in.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    sources = list(dict.fromkeys(sources or SEARCH_SOURCES))
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        matches = search_tsvector(session, terms, sources, limit, offset)
+    elif dialect == "sqlite" and search_index_exists(session.connection()):
+        matches = search_fts5(session, terms, sources, limit, offset)
+    else:
+        matches = search_like(session, terms, sources, limit, offset)
+
+    details = {}
+    for source in {source for source, *_ in matches}:
+        spec = SEARCH_SOURCES[source]
+        shift_column = getattr(spec.model, spec.shift_id) if spec.shift_id else null()
+        rows = session.exec(
+            select(spec.model.id, getattr(spec.model, spec.timestamp), shift_column)
+            .where(spec.model.id.in_([id for hit_source, id, *_ in matches if hit_source == source]))
+        )
+        details.update({(source, id): (timestamp, shift_id) for id, timestamp, shift_id in rows})
+
+    hits = []
+    for source, id, snippet, rank in matches:
+        if (source, id) not in details: # Deleted since it was indexed
+            continue
+        timestamp, shift_id = details[(source, id)]
+        if shift_id is None:
+            shift_id = shift_at(session, timestamp)
+        hits.append({
+            "source": source, "id": id, "shift_id": shift_id,
+            "timestamp": timestamp, "snippet": snippet, "rank": rank,
+        })
+    return hits
@@ -1,4 +1,8 @@
 # app/security.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -9,14 +13,77 @@ from passlib.context import CryptContext
 SECRET_KEY = "tu-super-secreto-y-largo-string-aleatorio"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 # The token will be valid for 30 minutes
+USER_CACHE_MAX_SIZE = 1024 # Authenticated tokens kept in memory
+USER_CACHE_TTL_SECONDS = 60 # Re-read the user from the database at least once a minute
+PASSWORD_HASH_WORKERS = 4 # Upper bound on concurrent bcrypt computations
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies a plain-text password against its hash.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await password_verifier.verify(plain_password, hashed_password)
+
+class PasswordVerificationService:
+    """
+    Runs bcrypt verification on a bounded thread pool and keeps latency statistics.
+    bcrypt releases the GIL, so independent checks run truly in parallel, while the
+    pool size caps how much CPU a burst of logins can take from other requests.
+    Callers await the result, so a queued check holds no request thread.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+        self._last_seconds = 0.0
+        self._in_flight = 0
+
+    def _timed_verify(self, plain_password: str, hashed_password: str) -> bool:
+        started = time.perf_counter()
+        try:
+            return pwd_context.verify(plain_password, hashed_password)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._in_flight -= 1
+                self._count += 1
+                self._total_seconds += elapsed
+                self._last_seconds = elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    def _submit(self, plain_password: str, hashed_password: str):
+        with self._lock:
+            self._in_flight += 1
+        return self._executor.submit(self._timed_verify, plain_password, hashed_password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(self._submit(plain_password, hashed_password))
+
+    async def verify_many(self, credentials: list[tuple[str, str]]) -> list[bool]:
+        """
+        Verify several (plain_password, hashed_password) pairs concurrently.
+        Results are returned in the same order as the input.
+        """
+        futures = [asyncio.wrap_future(self._submit(plain, hashed)) for plain, hashed in credentials]
+        return list(await asyncio.gather(*futures))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "verifications": self._count,
+                "avg_ms": round(self._total_seconds / self._count * 1000, 2) if self._count else None,
+                "max_ms": round(self._max_seconds * 1000, 2),
+                "last_ms": round(self._last_seconds * 1000, 2),
+            }
+
+password_verifier = PasswordVerificationService(max_workers=PASSWORD_HASH_WORKERS)
 
 def get_password_hash(password: str) -> str:
     """
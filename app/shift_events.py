@@ -0,0 +1,160 @@
+# app/shift_events.py
+"""
+Change feed for shift data. Rows are serialized when a session flushes them and
+published to the subscribers of their shift when it commits. The hub lives in one
+process: a console only sees changes committed by the worker serving its stream.
+"""
+import asyncio
+import itertools
+import json
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Callable, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+from app.models import (
+    Shift, EquipmentStatusLog, EventLog, TaskLog, NoveltyLog, GenerationRamp,
+    TankReading, OperationalReading, MaintenanceTicket, License
+)
+from app.schemas import (
+    ShiftRead, StatusLogRead, EventLogRead, TaskLogRead, NoveltyLogRead, GenerationRampRead,
+    TankReadingRead, OperationalReadingRead, MaintenanceTicketRead, LicenseRead
+)
+
+SUBSCRIBER_QUEUE_SIZE = 256
+PENDING_CHANGES_KEY = "pending_shift_changes"
+
+class ShiftChange(NamedTuple):
+    seq: int
+    shift_id: Optional[int]
+    kind: str
+    data: dict
+
+class TrackedModel(NamedTuple):
+    kind: str
+    schema: type[SQLModel]
+    shift_id: Callable[[Any], Optional[int]]
+
+TRACKED_MODELS: dict[type, TrackedModel] = {}
+
+def track_model(model: type, kind: str, schema: type[SQLModel], shift_id: Callable[[Any], Optional[int]] = lambda obj: obj.shift_id) -> None:
+    """
+    Publish inserts and updates of `model`, serialized with `schema`, as changes of kind `kind`.
+    """
+    TRACKED_MODELS[model] = TrackedModel(kind, schema, shift_id)
+
+track_model(Shift, "shift", ShiftRead, lambda shift: shift.id)
+track_model(EquipmentStatusLog, "status_log", StatusLogRead)
+track_model(EventLog, "event", EventLogRead)
+track_model(TaskLog, "task_log", TaskLogRead)
+track_model(NoveltyLog, "novelty", NoveltyLogRead)
+track_model(GenerationRamp, "ramp", GenerationRampRead)
+track_model(TankReading, "tank_reading", TankReadingRead)
+track_model(OperationalReading, "operational_reading", OperationalReadingRead)
+# Not tied to a shift: no stream receives them, but commit listeners do.
+track_model(MaintenanceTicket, "maintenance_ticket", MaintenanceTicketRead, lambda ticket: None)
+track_model(License, "license", LicenseRead, lambda license: None)
+
+_sequence = itertools.count(1)
+
+def make_change(obj) -> Optional[ShiftChange]:
+    tracked = TRACKED_MODELS.get(type(obj))
+    if tracked is None:
+        return None
+    data = tracked.schema.model_validate(obj).model_dump(mode="json")
+    return ShiftChange(next(_sequence), tracked.shift_id(obj), tracked.kind, data)
+
+def stage_changes(session: Session, objects) -> None:
+    """
+    Queue changes for rows written outside the unit of work (bulk INSERT / UPDATE statements).
+    """
+    pending = session.info.setdefault(PENDING_CHANGES_KEY, [])
+    for obj in objects:
+        change = make_change(obj)
+        if change is not None:
+            pending.append(change)
+
+class ShiftEventHub:
+    """
+    In-process publish/subscribe of shift changes. publish() may be called from any
+    thread; each subscriber receives changes on its own event loop through a bounded queue.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._listeners: list[Callable[[list[ShiftChange]], None]] = []
+        self._lock = threading.Lock()
+
+    def add_commit_listener(self, listener: Callable[[list[ShiftChange]], None]) -> None:
+        """
+        Call `listener` with the changes of every commit, on the committing thread.
+        """
+        self._listeners.append(listener)
+
+    @asynccontextmanager
+    async def subscribe(self, shift_id: int):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=self.queue_size))
+        with self._lock:
+            self._subscribers.setdefault(shift_id, set()).add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(shift_id, set())
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(shift_id, None)
+
+    def subscriber_count(self, shift_id: Optional[int] = None) -> int:
+        with self._lock:
+            if shift_id is not None:
+                return len(self._subscribers.get(shift_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, changes: list[ShiftChange]) -> None:
+        for listener in self._listeners:
+            listener(changes)
+        with self._lock:
+            targets = [
+                (loop, queue, change)
+                for change in changes
+                for loop, queue in self._subscribers.get(change.shift_id, ())
+            ]
+        for loop, queue, change in targets:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, change)
+            except RuntimeError: # The subscriber's loop is already closed
+                pass
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, change: ShiftChange) -> None:
+        if queue.full():
+            # A console that cannot keep up drops its backlog and is told to reload.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(ShiftChange(change.seq, change.shift_id, "resync", {}))
+            return
+        queue.put_nowait(change)
+
+shift_event_hub = ShiftEventHub()
+
+def format_sse(change: ShiftChange) -> str:
+    return f"id: {change.seq}\nevent: {change.kind}\ndata: {json.dumps(change.data)}\n\n"
+
+@event.listens_for(Session, "after_flush")
+def collect_flushed_changes(session: Session, flush_context) -> None:
+    stage_changes(session, [*session.new, *(obj for obj in session.dirty if session.is_modified(obj))])
+
+@event.listens_for(Session, "after_commit")
+def publish_committed_changes(session: Session) -> None:
+    changes = session.info.pop(PENDING_CHANGES_KEY, None)
+    if changes:
+        shift_event_hub.publish(changes)
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_rolled_back_changes(session: Session, previous_transaction) -> None:
+    session.info.pop(PENDING_CHANGES_KEY, None)
@@ -0,0 +1,90 @@
+# app/shift_registry.py
+"""
+In-process registry of closed shifts. Closed shifts never reopen, so the write guard
+can reject them without a query. Open shifts are never taken from here: their state
+is read from the database inside the writing transaction.
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlmodel import Session, select
+
+from app.cache import TTLCache
+from app.models import Shift
+
+SHIFT_REGISTRY_MAX_SIZE = 4096
+
+class ShiftState(NamedTuple):
+    shift_id: int
+    status: str
+    owner_id: Optional[int] # incoming_superintendent_id
+    start_time: datetime
+    scheduled_group_id: Optional[int]
+
+    @property
+    def is_open(self) -> bool:
+        return self.status == "OPEN"
+
+    @classmethod
+    def from_shift(cls, shift: Shift) -> "ShiftState":
+        return cls(shift.id, shift.status, shift.incoming_superintendent_id, shift.start_time, shift.scheduled_group_id)
+
+SHIFT_STATE_COLUMNS = (
+    Shift.id, Shift.status, Shift.incoming_superintendent_id, Shift.start_time, Shift.scheduled_group_id
+)
+
+def shift_state_query(shift_id: int, lock: bool = False):
+    """
+    Narrow SELECT of a shift's state. With `lock`, the row stays locked until the
+    transaction ends (FOR NO KEY UPDATE, the lock the version bump takes anyway), so a
+    handover cannot close the shift between the check and the write.
+    """
+    statement = select(*SHIFT_STATE_COLUMNS).where(Shift.id == shift_id)
+    return statement.with_for_update(key_share=True) if lock else statement
+
+class ShiftRegistry:
+
+    def __init__(self, maxsize: int = SHIFT_REGISTRY_MAX_SIZE):
+        self._states = TTLCache(maxsize=maxsize, ttl=None)
+
+    def get(self, shift_id: int) -> Optional[ShiftState]:
+        return self._states.get(shift_id)
+
+    def remember(self, state: ShiftState) -> None:
+        """
+        Keep a closed state. An open one may be closed by another process at any time, so it is not kept.
+        """
+        if state.is_open:
+            self._states.pop(state.shift_id)
+        else:
+            self._states.set(state.shift_id, state)
+
+    def update(self, shift: Shift) -> None:
+        """
+        Record the committed state of a shift. Called after every change to status, owner or group.
+        """
+        self.remember(ShiftState.from_shift(shift))
+
+    def lookup(self, session: Session, shift_id: int, lock: bool = False) -> Optional[ShiftState]:
+        """
+        State of a shift: from the registry if it is closed, otherwise from the database.
+        """
+        state = self.get(shift_id)
+        if state is not None:
+            return state
+        return self.remember_row(session.exec(shift_state_query(shift_id, lock)).first())
+
+    def remember_row(self, row) -> Optional[ShiftState]:
+        """
+        Record a row selected with shift_state_query(). None (no such shift) is passed through.
+        """
+        if row is None:
+            return None
+        state = ShiftState(*row)
+        self.remember(state)
+        return state
+
+    def clear(self) -> None:
+        self._states.clear()
+
+shift_registry = ShiftRegistry()
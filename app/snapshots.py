@@ -0,0 +1,119 @@
+# app/snapshots.py
+"""
+Closed shift report snapshots, serialized once at handover and served as stored bytes.
+Backfill with: python -m app.snapshots [--rebuild]
+"""
+import gzip
+import hashlib
+import sys
+
+from fastapi import Request, Response
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from app.models import (
+    Shift, ShiftReportSnapshot, TaskLog, NoveltyLog, GenerationRamp, OperationalReading
+)
+from app.schemas import ShiftReadWithDetails
+from app.cache import TTLCache
+from app.compression import compress, negotiate_encoding
+from app.http_cache import REPORT_CACHE_CONTROL, conditional_headers
+
+# Eager loads for every relationship serialized by ShiftReadWithDetails.
+SHIFT_DETAIL_OPTIONS = (
+    selectinload(Shift.scheduled_group),
+    selectinload(Shift.status_logs),
+    selectinload(Shift.event_logs),
+    selectinload(Shift.task_logs).selectinload(TaskLog.user),
+    selectinload(Shift.task_logs).selectinload(TaskLog.scheduled_task),
+    selectinload(Shift.novelty_logs).selectinload(NoveltyLog.user),
+    selectinload(Shift.generation_ramps).selectinload(GenerationRamp.user),
+    selectinload(Shift.operational_readings).selectinload(OperationalReading.parameter),
+    selectinload(Shift.operational_readings).selectinload(OperationalReading.equipment),
+    selectinload(Shift.operational_readings).selectinload(OperationalReading.user),
+)
+
+# Brotli / zstd encodings of snapshots, keyed by (content digest, coding). Closed reports never change.
+compressed_variants = TTLCache(maxsize=256, ttl=None)
+
+def serialize_report(shift: Shift) -> bytes:
+    return ShiftReadWithDetails.model_validate(shift).model_dump_json().encode()
+
+def store_report_snapshot(session: Session, shift_id: int) -> ShiftReportSnapshot:
+    """
+    Serialize the full report of a shift and add (or replace) its snapshot in the session.
+    Pending changes must be flushed first so the snapshot reflects them. The caller commits.
+    """
+    statement = (
+        select(Shift)
+        .where(Shift.id == shift_id)
+        .options(*SHIFT_DETAIL_OPTIONS)
+        .execution_options(populate_existing=True)
+    )
+    shift = session.exec(statement).one()
+    content = serialize_report(shift)
+
+    snapshot = session.get(ShiftReportSnapshot, shift_id) or ShiftReportSnapshot(shift_id=shift_id)
+    snapshot.content_encoding = "gzip"
+    snapshot.content_digest = hashlib.sha256(content).hexdigest()
+    snapshot.raw_size = len(content)
+    # mtime=0 keeps the compressed bytes deterministic for the same content.
+    snapshot.payload = gzip.compress(content, compresslevel=6, mtime=0)
+    session.add(snapshot)
+    return snapshot
+
+def report_etag(content_digest: str, content_encoding: str) -> str:
+    # Each content coding is a distinct representation and gets its own strong validator.
+    return f'"{content_digest}-{content_encoding}"'
+
+def snapshot_response(snapshot: ShiftReportSnapshot, request: Request) -> Response:
+    """
+    Serve a snapshot in the best content coding the client accepts.
+    gzip is served as stored; brotli and zstd variants are compressed once and kept in memory.
+    Answers 304 Not Modified when the client already holds the same representation.
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    headers = conditional_headers(request, report_etag(snapshot.content_digest, encoding), REPORT_CACHE_CONTROL)
+    headers["Vary"] = "Accept-Encoding"
+    if encoding == "identity":
+        return Response(content=gzip.decompress(snapshot.payload), media_type="application/json", headers=headers)
+
+    if encoding == snapshot.content_encoding:
+        body = snapshot.payload
+    else:
+        variant_key = (snapshot.content_digest, encoding)
+        body = compressed_variants.get(variant_key)
+        if body is None:
+            body = compress(gzip.decompress(snapshot.payload), encoding)
+            compressed_variants.set(variant_key, body)
+    headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def live_report_response(shift: Shift, request: Request) -> Response:
+    """
+    Serialize a closed shift without a snapshot, validated by the same content digest.
+    """
+    content = serialize_report(shift)
+    etag = report_etag(hashlib.sha256(content).hexdigest(), "identity")
+    headers = conditional_headers(request, etag, REPORT_CACHE_CONTROL)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+def build_missing_snapshots(session: Session, rebuild: bool = False) -> int:
+    query = select(Shift.id).where(Shift.status == "CLOSED").order_by(Shift.id)
+    if not rebuild:
+        query = query.where(Shift.id.not_in(select(ShiftReportSnapshot.shift_id)))
+    shift_ids = session.exec(query).all()
+    for shift_id in shift_ids:
+        store_report_snapshot(session, shift_id)
+        session.commit()
+        session.expunge_all()
+    return len(shift_ids)
+
+if __name__ == "__main__":
+    from app.database import engine
+    from app.migrations import run_migrations
+
+    run_migrations(engine)
+    with Session(engine) as session:
+        count = build_missing_snapshots(session, rebuild="--rebuild" in sys.argv)
+    print(f"Stored {count} report snapshots.")
@@ -0,0 +1,104 @@
+# app/tank_forecast.py
+"""
+Consumption rate and days of autonomy per tank, from a least-squares line through
+the readings since the last refill. Cached per tank until a new reading is committed;
+other worker processes see it after TANK_FORECAST_TTL_SECONDS.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.cache import TTLCache
+from app.models import Tank, TankReading
+from app.shift_events import ShiftChange, shift_event_hub
+
+FORECAST_WINDOW_DAYS = 14
+FORECAST_MAX_READINGS = 1000
+# A rise of more than this share of the capacity between two readings is a refill.
+REFILL_RISE_FRACTION = 0.02
+TANK_FORECAST_TTL_SECONDS = int(os.getenv("TANK_FORECAST_TTL_SECONDS", "300"))
+HOURS_PER_DAY = 24
+MAX_PROJECTION_DAYS = 3650 # Beyond this the tank is effectively not being drawn down
+
+class ConsumptionModel(NamedTuple):
+    level_liters: Optional[float]
+    reading_timestamp: Optional[datetime]
+    readings_used: int
+    consumption_liters_per_day: Optional[float]
+    r_squared: Optional[float]
+
+forecast_cache = TTLCache(maxsize=1024, ttl=TANK_FORECAST_TTL_SECONDS)
+
+def fit_consumption(timestamps: np.ndarray, levels: np.ndarray, capacity_liters: float) -> ConsumptionModel:
+    """
+    Fit level = a + b * hours over the readings since the last refill. Readings are in time order.
+    """
+    if len(levels) == 0:
+        return ConsumptionModel(None, None, 0, None, None)
+    rises = np.flatnonzero(np.diff(levels) > REFILL_RISE_FRACTION * capacity_liters)
+    first = rises[-1] + 1 if len(rises) else 0
+    timestamps, levels = timestamps[first:], levels[first:]
+    latest = ConsumptionModel(float(levels[-1]), timestamps[-1].astype(datetime), len(levels), None, None)
+
+    hours = (timestamps - timestamps[0]) / np.timedelta64(1, "h")
+    if len(levels) < 2 or hours[-1] <= 0:
+        return latest
+    slope, intercept = np.polyfit(hours, levels, 1)
+    residuals = levels - (intercept + slope * hours)
+    total = np.sum((levels - levels.mean()) ** 2)
+    r_squared = 1 - np.sum(residuals ** 2) / total if total > 0 else 1.0
+    return latest._replace(consumption_liters_per_day=float(-slope * HOURS_PER_DAY), r_squared=float(r_squared))
+
+def consumption_model(session: Session, tank: Tank) -> ConsumptionModel:
+    """
+    Cached consumption model of a tank, refitted from its recent readings on a miss.
+    """
+    model = forecast_cache.get(tank.id)
+    if model is not None:
+        return model
+    rows = session.exec(
+        select(TankReading.reading_timestamp, TankReading.level_liters)
+        .where(TankReading.tank_id == tank.id)
+        .order_by(TankReading.reading_timestamp.desc(), TankReading.id.desc())
+        .limit(FORECAST_MAX_READINGS)
+    ).all()
+    rows.reverse()
+    timestamps = np.array([timestamp for timestamp, _ in rows], dtype="datetime64[us]")
+    levels = np.array([level for _, level in rows], dtype=np.float64)
+    if len(timestamps):
+        recent = timestamps >= timestamps[-1] - np.timedelta64(FORECAST_WINDOW_DAYS, "D")
+        timestamps, levels = timestamps[recent], levels[recent]
+    model = fit_consumption(timestamps, levels, tank.capacity_liters)
+    forecast_cache.set(tank.id, model)
+    return model
+
+def tank_forecast(session: Session, tank: Tank) -> dict:
+    model = consumption_model(session, tank)
+    rate = model.consumption_liters_per_day
+    days_of_autonomy = model.level_liters / rate if rate and rate > 0 else None
+    return {
+        "tank_id": tank.id,
+        "tank_name": tank.name,
+        "resource_type": tank.resource_type,
+        "capacity_liters": tank.capacity_liters,
+        "level_liters": model.level_liters,
+        "reading_timestamp": model.reading_timestamp,
+        "readings_used": model.readings_used,
+        "consumption_liters_per_day": rate,
+        "r_squared": model.r_squared,
+        "days_of_autonomy": days_of_autonomy,
+        "projected_empty_at": (
+            model.reading_timestamp + timedelta(days=days_of_autonomy)
+            if days_of_autonomy is not None and days_of_autonomy <= MAX_PROJECTION_DAYS else None
+        ),
+    }
+
+def invalidate_tank_forecasts(changes: list[ShiftChange]) -> None:
+    for change in changes:
+        if change.kind == "tank_reading":
+            forecast_cache.pop(change.data["tank_id"])
+
+shift_event_hub.add_commit_listener(invalidate_tank_forecasts)
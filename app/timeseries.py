@@ -0,0 +1,66 @@
+# app/timeseries.py
+"""
+Vectorized helpers for operational time series.
+"""
+import math
+from datetime import datetime
+from typing import Sequence
+
+import numpy as np
+
+# Upper bound on the number of buckets a single series request may produce.
+MAX_SERIES_BUCKETS = 5000
+DEFAULT_SERIES_POINTS = 500
+
+def auto_bucket_seconds(start: datetime, end: datetime, points: int = DEFAULT_SERIES_POINTS) -> int:
+    """
+    Smallest whole-second bucket width that splits [start, end) into at most `points` buckets.
+    """
+    return max(1, math.ceil((end - start).total_seconds() / points))
+
+def bucket_count(start: datetime, end: datetime, bucket_seconds: int) -> int:
+    return math.ceil((end - start).total_seconds() / bucket_seconds)
+
+def downsample(
+    timestamps: Sequence[datetime],
+    values: Sequence[float],
+    start: datetime,
+    bucket_seconds: int,
+) -> list[dict]:
+    """
+    Aggregate readings sorted by timestamp into fixed-width buckets aligned on `start`.
+    Returns min / max / avg / last / count for every bucket that holds at least one reading.
+    """
+    if len(timestamps) == 0:
+        return []
+
+    times = np.array(timestamps, dtype="datetime64[us]")
+    data = np.asarray(values, dtype=np.float64)
+    origin = np.datetime64(start, "us")
+    width = np.timedelta64(bucket_seconds, "s")
+
+    bucket_index = (times - origin) // width
+    # Readings are sorted, so each bucket is a contiguous run starting where the index changes.
+    run_starts = np.flatnonzero(np.diff(bucket_index)) + 1
+    run_starts = np.concatenate(([0], run_starts))
+    run_ends = np.concatenate((run_starts[1:], [len(data)]))
+
+    counts = run_ends - run_starts
+    minimums = np.minimum.reduceat(data, run_starts)
+    maximums = np.maximum.reduceat(data, run_starts)
+    averages = np.add.reduceat(data, run_starts) / counts
+    lasts = data[run_ends - 1]
+    bucket_starts = (origin + bucket_index[run_starts] * width).tolist()
+
+    return [
+        {
+            "bucket_start": bucket_start,
+            "min": float(minimum),
+            "max": float(maximum),
+            "avg": float(average),
+            "last": float(last),
+            "count": int(count),
+        }
+        for bucket_start, minimum, maximum, average, last, count
+        in zip(bucket_starts, minimums, maximums, averages, lasts, counts)
+    ]
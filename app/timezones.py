@@ -0,0 +1,15 @@
+# app/timezones.py
+"""
+Timestamps are stored as naive UTC. Query parameters may carry an offset
+(the UI sends toISOString() values ending in Z), so convert them at the edge.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    The same instant as a naive UTC datetime. Naive values are assumed to be UTC already.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
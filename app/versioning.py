@@ -0,0 +1,58 @@
+# app/versioning.py
+"""
+Per-shift change versions for delta sync. Every flush that writes a shift or one of
+its logs increments Shift.version and stamps the new value on the written rows'
+change_version (see GET /shifts/{id}/changes).
+"""
+from typing import Iterable
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Shift, EquipmentStatusLog, EventLog, TaskLog, NoveltyLog, GenerationRamp,
+    TankReading, OperationalReading
+)
+
+VERSIONED_MODELS = (
+    EquipmentStatusLog, EventLog, TaskLog, NoveltyLog, GenerationRamp, TankReading, OperationalReading
+)
+
+def bump_shift_versions(session: Session, shift_ids: Iterable[int]) -> dict[int, int]:
+    """
+    Increment the version of each shift and return the new versions.
+    """
+    new_versions = {}
+    returning = session.get_bind().dialect.update_returning
+    for shift_id in sorted(set(shift_ids)):
+        statement = update(Shift).where(Shift.id == shift_id).values(version=Shift.version + 1)
+        if returning:
+            new_version = session.execute(
+                statement.returning(Shift.version).execution_options(synchronize_session=False)
+            ).scalar_one_or_none()
+        else:
+            session.execute(statement.execution_options(synchronize_session=False))
+            new_version = session.execute(select(Shift.version).where(Shift.id == shift_id)).scalar_one_or_none()
+        if new_version is not None:
+            new_versions[shift_id] = new_version
+    return new_versions
+
+def assign_change_versions(session: Session, rows: list, shifts: list[Shift] = ()) -> None:
+    """
+    Stamp log rows (and modified shifts) with a freshly bumped version of their shift.
+    """
+    new_versions = bump_shift_versions(session, [row.shift_id for row in rows] + [shift.id for shift in shifts])
+    for row in rows:
+        if row.shift_id in new_versions:
+            row.change_version = new_versions[row.shift_id]
+    for shift in shifts:
+        # Keep the in-memory copy in step with the row, so the flush writes the same value.
+        shift.version = new_versions.get(shift.id, shift.version)
+
+@event.listens_for(Session, "before_flush")
+def version_flushed_rows(session: Session, flush_context, instances) -> None:
+    rows = [obj for obj in session.new if isinstance(obj, VERSIONED_MODELS)]
+    rows += [obj for obj in session.dirty if isinstance(obj, VERSIONED_MODELS) and session.is_modified(obj)]
+    shifts = [obj for obj in session.dirty if isinstance(obj, Shift) and session.is_modified(obj)]
+    if rows or shifts:
+        assign_change_versions(session, rows, shifts)
@@ -1,14 +1,16 @@
 # seed.py
-from sqlmodel import Session, SQLModel
+from sqlmodel import Session
 from sqlalchemy import delete 
 from app.database import engine
+from app.migrations import run_migrations
 from app.models import (
     User, Position, Employee, ShiftGroup, Equipment,
     Shift, EventLog, NoveltyLog, GroupMembership,
     ShiftAttendance, EquipmentStatusLog, TaskLog,
     GenerationRamp, TankReading, OperationalReading, 
     MaintenanceTicket, License, Tank, ScheduledTask, 
-    OperationalParameter
+    OperationalParameter, ShiftReportSnapshot, OperationalReadingRollup,
+    EquipmentStatusInterval
 )
 from app.enums import (
     UserRole, EmployeeType, EquipmentStatus, EventType, 
@@ -37,12 +39,13 @@ EQUIPMENT_DATA = [
 def seed_database():
     print("Starting the seeding process...")
     
-    SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
     
     with Session(engine) as session:
         print("Clearing the database...")
         session.execute(delete(GroupMembership))
         session.execute(delete(ShiftAttendance))
+        session.execute(delete(EquipmentStatusInterval))
         session.execute(delete(EquipmentStatusLog))
         session.execute(delete(EventLog))
         session.execute(delete(TaskLog))
@@ -50,6 +53,8 @@ def seed_database():
         session.execute(delete(GenerationRamp))
         session.execute(delete(TankReading))
         session.execute(delete(OperationalReading)) 
+        session.execute(delete(OperationalReadingRollup))
+        session.execute(delete(ShiftReportSnapshot))
         session.execute(delete(MaintenanceTicket))
         session.execute(delete(License))
         session.commit()
@@ -0,0 +1,40 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The engine is created at import time, so point it at a scratch database first.
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import seed
+from app.kpis import kpi_cache
+from app.main import app
+from app.routers.login import user_cache
+from app.shift_registry import shift_registry
+
+@pytest.fixture()
+def client():
+    seed.seed_database()
+    # Re-seeding reuses ids, so drop whatever the previous test left in the per-process caches.
+    for cache in (shift_registry, user_cache, kpi_cache):
+        cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+
+def login(client: TestClient, username: str, password: str) -> dict:
+    response = client.post("/token", data={"username": username, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture()
+def superintendent(client) -> dict:
+    return login(client, "demo_user", "demopass123")
+
+@pytest.fixture()
+def manager(client) -> dict:
+    return login(client, "admin_ops", "adminpass123")
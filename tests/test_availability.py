@@ -0,0 +1,28 @@
+# tests/test_availability.py
+from datetime import datetime, timedelta
+
+def test_availability_accepts_utc_offsets(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    now = datetime.utcnow().replace(microsecond=0)
+    response = client.post(
+        f"/shifts/{shift_id}/equipment-status/",
+        json={"equipment_id": 1, "status": "IN_SERVICE", "timestamp": (now - timedelta(hours=3)).isoformat()},
+        headers=superintendent,
+    )
+    assert response.status_code == 201, response.text
+
+    response = client.get(
+        "/equipment/availability",
+        params={
+            "start": (now - timedelta(hours=2)).isoformat() + "Z",
+            "end": (now + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S+01:00"),
+            "equipment_id": 1,
+        },
+        headers=superintendent,
+    )
+    assert response.status_code == 200, response.text
+    (availability,) = response.json()
+    # end is now + 1h in +01:00, i.e. now in UTC: the range is exactly the last two hours.
+    assert availability["period_hours"] == 2.0
+    assert availability["hours_in_state"]["IN_SERVICE"] == 2.0
+    assert availability["availability_factor"] == 1.0
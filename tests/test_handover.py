@@ -0,0 +1,26 @@
+# tests/test_handover.py
+
+def handover(client, headers, shift_id, outgoing_password):
+    return client.post(
+        "/shifts/handover",
+        json={
+            "shift_to_close_id": shift_id,
+            "incoming_superintendent_username": "demo_user",
+            "incoming_superintendent_password": "demopass123",
+            "outgoing_superintendent_password": outgoing_password,
+        },
+        headers=headers,
+    )
+
+def test_handover_checks_passwords_then_opens_next_shift(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+
+    response = handover(client, superintendent, shift_id, "wrong-password")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid credentials for outgoing superintendent"
+
+    response = handover(client, superintendent, shift_id, "demopass123")
+    assert response.status_code == 200, response.text
+    new_shift = response.json()
+    assert new_shift["status"] == "OPEN" and new_shift["id"] != shift_id
+    assert client.get("/shifts/active/me", headers=superintendent).json()["id"] == new_shift["id"]
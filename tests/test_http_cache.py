@@ -0,0 +1,20 @@
+# tests/test_http_cache.py
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.database import engine
+from app.models import Equipment
+
+def test_catalog_etag_follows_content(client, superintendent):
+    etag = client.get("/equipment/", headers=superintendent).headers["ETag"]
+    response = client.get("/equipment/", headers={**superintendent, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    # A write committed elsewhere (another worker, a script) changes the tag without any notification.
+    with Session(engine) as session:
+        session.execute(update(Equipment).where(Equipment.id == 1).values(status="OUT_OF_SERVICE"))
+        session.commit()
+    response = client.get("/equipment/", headers={**superintendent, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["status"] == "OUT_OF_SERVICE"
@@ -0,0 +1,41 @@
+# tests/test_kpis.py
+from datetime import datetime, timedelta
+
+def active_licenses(client, headers, start, end):
+    response = client.get(
+        "/analytics/kpis",
+        params={"start": start.isoformat(), "end": end.isoformat(), "period": "DAY"},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    return [kpis["active_licenses"] for kpis in response.json()]
+
+def test_backdated_license_close_refreshes_cached_periods(client, superintendent):
+    today = datetime.utcnow().date()
+    start, end = today - timedelta(days=9), today - timedelta(days=2)
+    before = active_licenses(client, superintendent, start, end)
+
+    response = client.post(
+        "/licenses/",
+        json={
+            "license_number": "LIC-KPI-1",
+            "affected_unit": "Unit 1",
+            "description": "Backdated close",
+            "start_time": (datetime.utcnow() - timedelta(days=10)).isoformat(),
+        },
+        headers=superintendent,
+    )
+    assert response.status_code == 201, response.text
+    license_id = response.json()["id"]
+    opened = active_licenses(client, superintendent, start, end)
+    assert [count - base for count, base in zip(opened, before)] == [1] * 8
+
+    # Closed (in the past) periods are now cached; closing the license before them must drop them.
+    response = client.put(
+        f"/licenses/{license_id}/close",
+        json={"end_time": (datetime.utcnow() - timedelta(days=8)).isoformat()},
+        headers=superintendent,
+    )
+    assert response.status_code == 200, response.text
+    closed = active_licenses(client, superintendent, start, end)
+    assert [count - base for count, base in zip(closed, before)] == [1, 1, 0, 0, 0, 0, 0, 0]
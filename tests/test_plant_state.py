@@ -0,0 +1,20 @@
+# tests/test_plant_state.py
+from datetime import datetime, timedelta, timezone
+
+def test_plant_state_converts_offsets_to_utc(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    logged_at = datetime.utcnow().replace(microsecond=0) - timedelta(days=2)
+    response = client.post(
+        f"/shifts/{shift_id}/equipment-status/",
+        json={"equipment_id": 1, "status": "OUT_OF_SERVICE", "timestamp": logged_at.isoformat()},
+        headers=superintendent,
+    )
+    assert response.status_code == 201, response.text
+    log_id = response.json()["id"]
+
+    # Half an hour after the log, written at UTC-05:00: the wall-clock time is before it.
+    as_of = (logged_at + timedelta(minutes=30)).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=-5)))
+    response = client.get("/plant-state/", params={"as_of": as_of.isoformat()}, headers=superintendent)
+    assert response.status_code == 200, response.text
+    (equipment,) = [item for item in response.json()["equipment"] if item["equipment_id"] == 1]
+    assert (equipment["status"], equipment["status_log_id"]) == ("OUT_OF_SERVICE", log_id)
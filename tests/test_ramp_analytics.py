@@ -0,0 +1,29 @@
+# tests/test_ramp_analytics.py
+from datetime import datetime, timedelta, timezone
+
+def test_ramp_analytics_converts_offsets_to_utc(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    started = datetime.utcnow().replace(microsecond=0) - timedelta(days=2)
+    response = client.post(
+        f"/shifts/{shift_id}/ramps/",
+        json={
+            "cenace_operator_name": "CENACE-TZ",
+            "start_time": started.isoformat(),
+            "end_time": (started + timedelta(minutes=10)).isoformat(),
+            "initial_load_mw": 100.0,
+            "final_load_mw": 150.0,
+            "target_ramp_rate_mw_per_minute": 5.0,
+        },
+        headers=superintendent,
+    )
+    assert response.status_code == 201, response.text
+
+    minus_five = timezone(timedelta(hours=-5))
+    window = [(started + timedelta(minutes=delta)).replace(tzinfo=timezone.utc).astimezone(minus_five) for delta in (-30, 30)]
+    response = client.get(
+        "/analytics/ramps",
+        params={"start": window[0].isoformat(), "end": window[1].isoformat()},
+        headers=superintendent,
+    )
+    assert response.status_code == 200, response.text
+    assert [group["key"] for group in response.json()["by_operator"]] == ["CENACE-TZ"]
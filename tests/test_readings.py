@@ -0,0 +1,74 @@
+# tests/test_readings.py
+import io
+import warnings
+
+import pytest
+
+# 00:00 - 01:00 UTC, which holds only the first reading of log_readings().
+OFFSET_RANGE = {"start": "2026-10-17T02:00:00+02:00", "end": "2026-10-17T03:00:00+02:00"}
+
+def log_readings(client, superintendent, manager) -> int:
+    parameter = client.post("/operational-parameters/", json={"name": "Drum pressure", "unit": "bar"}, headers=manager)
+    assert parameter.status_code == 201, parameter.text
+    parameter_id = parameter.json()["id"]
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    for timestamp, value in [("2026-10-17T00:30:00", 10.0), ("2026-10-17T02:30:00", 99.0)]:
+        response = client.post(
+            f"/shifts/{shift_id}/operational-readings/",
+            json={"parameter_id": parameter_id, "equipment_id": 1, "value": value, "timestamp": timestamp},
+            headers=superintendent,
+        )
+        assert response.status_code == 201, response.text
+    return parameter_id
+
+def test_series_converts_offsets_to_utc(client, superintendent, manager):
+    parameter_id = log_readings(client, superintendent, manager)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        response = client.get(
+            "/operational-readings/series",
+            params={
+                "parameter_id": parameter_id,
+                "equipment_id": 1,
+                **OFFSET_RANGE,
+                "bucket_seconds": 3600,
+            },
+            headers=superintendent,
+        )
+    assert response.status_code == 200, response.text
+    points = response.json()["points"]
+    assert [(point["bucket_start"], point["count"], point["last"]) for point in points] == [("2026-10-17T00:00:00", 1, 10.0)]
+
+def test_columnar_export_is_not_compressed_again(client, superintendent):
+    pytest.importorskip("pyarrow")
+    response = client.get(
+        "/operational-readings/export",
+        params={"format": "parquet"},
+        headers={**superintendent, "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "content-encoding" not in response.headers
+    assert response.content.startswith(b"PAR1")
+
+def test_columnar_export_converts_offsets_to_utc(client, superintendent, manager):
+    pq = pytest.importorskip("pyarrow.parquet")
+    parameter_id = log_readings(client, superintendent, manager)
+    response = client.get(
+        "/operational-readings/export",
+        params={"format": "parquet", "parameter_id": parameter_id, **OFFSET_RANGE},
+        headers=superintendent,
+    )
+    assert response.status_code == 200, response.text
+    assert pq.read_table(io.BytesIO(response.content)).column("value").to_pylist() == [10.0]
+
+def test_rollups_convert_offsets_to_utc(client, superintendent, manager):
+    parameter_id = log_readings(client, superintendent, manager)
+    response = client.get(
+        "/operational-readings/rollups",
+        params={"parameter_id": parameter_id, "equipment_id": 1, "granularity": "HOUR", **OFFSET_RANGE},
+        headers=superintendent,
+    )
+    assert response.status_code == 200, response.text
+    assert [(rollup["bucket_start"], rollup["last_value"]) for rollup in response.json()] == [("2026-10-17T00:00:00", 10.0)]
@@ -0,0 +1,22 @@
+# tests/test_reports.py
+import json
+from datetime import datetime, timedelta, timezone
+
+from test_handover import handover
+
+def test_export_converts_offsets_to_utc(client, superintendent):
+    shift = client.get("/shifts/active/me", headers=superintendent).json()
+    assert handover(client, superintendent, shift["id"], "demopass123").status_code == 200
+
+    started = datetime.fromisoformat(shift["start_time"]).replace(tzinfo=timezone.utc)
+    plus_two = timezone(timedelta(hours=2))
+    response = client.get(
+        "/reports/export/shifts",
+        params={
+            "start": (started - timedelta(minutes=30)).astimezone(plus_two).isoformat(),
+            "end": (started + timedelta(minutes=30)).astimezone(plus_two).isoformat(),
+        },
+        headers=superintendent,
+    )
+    assert response.status_code == 200, response.text
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [shift["id"]]
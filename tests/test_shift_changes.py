@@ -0,0 +1,25 @@
+# tests/test_shift_changes.py
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.database import engine
+from app.models import EventLog, Shift
+
+def test_full_fetch_includes_rows_from_before_versioning(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    response = client.post(
+        f"/shifts/{shift_id}/events/",
+        json={"description": "Boiler trip", "event_type": "FORCED_OUTAGE", "timestamp": "2026-10-17T00:30:00"},
+        headers=superintendent,
+    )
+    assert response.status_code == 201, response.text
+
+    # Rows and shifts that existed before the upgrade carry the column defaults.
+    with Session(engine) as session:
+        session.execute(update(EventLog).where(EventLog.shift_id == shift_id).values(change_version=0))
+        session.execute(update(Shift).where(Shift.id == shift_id).values(version=0))
+        session.commit()
+
+    changes = client.get(f"/shifts/{shift_id}/changes", params={"since": 0}, headers=superintendent).json()
+    assert changes["version"] == 0
+    assert "Boiler trip" in [log["description"] for log in changes["event_logs"]]
@@ -0,0 +1,35 @@
+# tests/test_shift_registry.py
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.database import engine
+from app.models import Shift, ShiftGroup
+
+EVENT = {"description": "Boiler trip", "event_type": "FORCED_OUTAGE", "timestamp": "2026-10-17T00:30:00"}
+
+def test_write_guard_sees_handover_from_another_process(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    response = client.post(f"/shifts/{shift_id}/events/", json=EVENT, headers=superintendent)
+    assert response.status_code == 201, response.text
+
+    # Another worker closes the shift; this process gets no notification.
+    with Session(engine) as session:
+        session.execute(update(Shift).where(Shift.id == shift_id).values(status="CLOSED"))
+        session.commit()
+    response = client.post(f"/shifts/{shift_id}/events/", json=EVENT, headers=superintendent)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cannot add logs to a closed shift"
+
+def test_assign_group_reads_the_shift_row(client, superintendent):
+    shift_id = client.get("/shifts/active/me", headers=superintendent).json()["id"]
+    with Session(engine) as session:
+        groups = [ShiftGroup(name="Group A"), ShiftGroup(name="Group B")]
+        session.add_all(groups)
+        session.commit()
+        group_a, group_b = (group.id for group in groups)
+        session.execute(update(Shift).where(Shift.id == shift_id).values(scheduled_group_id=group_a))
+        session.commit()
+
+    response = client.post(f"/shifts/{shift_id}/assign-group", json={"group_id": group_b}, headers=superintendent)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "A group has already been assigned to this shift"